@@ -3,218 +3,316 @@
 Enhanced debug script to see exactly what's happening with message detection.
 This will show you exactly why messages are being filtered out.
 """
+import argparse
 import asyncio
+import logging
 import sys
+import time
+import traceback
 from pathlib import Path
-from datetime import datetime, timedelta
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
-from src.client.telegram_client import TelegramClientManager
+from src.client.telegram_client import get_shared_client, stop_shared_client
 from src.services.news_detector import NewsDetector
 from src.services.news_filter import NewsFilter
 
-async def debug_channel_messages():
-    """Debug what messages are in the channels and why they're being filtered."""
+log = logging.getLogger(__name__)
+
+# Upper bound on channels scanned concurrently
+MAX_CONCURRENT_SCANS = 3
+_SCAN_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_SCANS)
+
+# Channels analyzed by debug_channel_messages
+CHANNELS = ["goldonline2016", "twiier_news"]
+
+# Sample messages test_sample_messages expects to be detected
+SAMPLE_MESSAGES = [
+    "قیمت طلای ۱۸ عیار امروز ۲ میلیون و ۵۰۰ هزار تومان اعلام شد",
+    "نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید",
+    "سکه طلا امروز با افزایش ۱۰۰ هزار تومانی همراه بود",
+    "بازار ارز امروز با نوسان شدیدی همراه بود",
+    "یورو در مقابل تومان به ۵۵ هزار تومان رسید",
+    "بورس تهران امروز با رشد ۲ درصدی بسته شد",
+    "تحریم های جدید آمریکا بر اقتصاد ایران تاثیر گذاشت",
+    "تحلیل بازار طلا: انتظار افزایش قیمت تا پایان هفته",
+    "شاخص دلار جهانی امروز کاهش یافت",
+    "قیمت نفت برنت به ۷۰ دلار رسید"
+]
+
+async def scan_channel(client_manager, detector, channel_name, cutoff_ts):
+    """
+    Analyze recent messages of a single channel.
     
-    print("🔍 DETAILED CHANNEL MESSAGE ANALYSIS")
-    print("=" * 80)
+    At most MAX_CONCURRENT_SCANS channels are scanned at once so a long
+    channel list doesn't run into Telegram flood waits.
+    """
+    async with _SCAN_SEMAPHORE:
+        return await _scan_channel_messages(client_manager, detector, channel_name, cutoff_ts)
+
+async def _scan_channel_messages(client_manager, detector, channel_name, cutoff_ts):
+    """
+    Collect the analysis report for a single channel.
     
-    # Create client and detector
-    client_manager = TelegramClientManager()
-    detector = NewsDetector()
+    Report lines are collected rather than printed so that concurrent scans
+    don't interleave their output. Per-message detail is only formatted when
+    INFO logging is enabled; filter errors and the channel summary are always
+    reported. Messages arrive newest first, so the scan stops at the first
+    one older than cutoff_ts (epoch seconds).
     
-    try:
-        # Start client
-        if not await client_manager.start():
-            print("❌ Failed to start Telegram client")
-            return
+    Returns:
+        tuple: (channel_name, message_count, news_detected_count, report_lines)
+    """
+    verbose = log.isEnabledFor(logging.INFO)
+    report = []
+    out = report.append
+    
+    # Get channel entity
+    channel_username = f"@{channel_name}"
+    channel_entity = await client_manager.client.get_entity(channel_username)
+    
+    if verbose:
+        out(f"\n📺 ANALYZING CHANNEL: {channel_name}")
+        out("=" * 60)
+        out(f"✅ Connected to {channel_username}")
+        out(f"📊 Channel Title: {getattr(channel_entity, 'title', 'Unknown')}")
+        out(f"👥 Members: {getattr(channel_entity, 'participants_count', 'Unknown')}")
+        out(f"\n📥 Analyzing last 50 messages (last 24 hours)")
+        out("-" * 40)
+    
+    message_count = 0
+    processed_count = 0
+    news_detected_count = 0
+    relevant_count = 0
+    
+    now_ts = time.time()
+    async for message in client_manager.client.iter_messages(channel_entity, limit=50):
+        # Everything from here on is older; don't fetch it
+        message_ts = message.date.timestamp()
+        if message_ts < cutoff_ts:
+            if verbose:
+                out("\n⏰ Reached messages older than 24 hours, stopping")
+            break
+        
+        message_count += 1
+        
+        if verbose:
+            # Check message age
+            message_age_hours = (now_ts - message_ts) / 3600
+            
+            out(f"\n📝 MESSAGE {message_count} (ID: {message.id})")
+            out(f"🕐 Age: {message_age_hours:.1f} hours ago")
+            out(f"📏 Length: {len(message.text) if message.text else 0} chars")
+        
+        # Skip if no text
+        if not message.text:
+            if verbose:
+                out("❌ SKIPPED: No text content")
+            continue
+        
+        # Skip if too short; only strip (and copy) text with surrounding whitespace
+        text = message.text
+        if len(text) < 30 or ((text[0].isspace() or text[-1].isspace()) and len(text.strip()) < 30):
+            if verbose:
+                out("❌ SKIPPED: Too short (< 30 chars)")
+            continue
+        
+        processed_count += 1
         
-        # Check both channels
-        channels = ["goldonline2016", "twiier_news"]
+        if verbose:
+            # Show message preview
+            preview = message.text[:150].replace('\n', ' ')
+            out(f"📄 Preview: {preview}...")
+            
+            # Test financial news detection
+            out("\n🔍 DETECTION ANALYSIS:")
+        
+        # Step 1: Basic news detection
+        is_news = detector.is_news(message.text)
+        if verbose:
+            out(f"   📊 Is News: {'✅ YES' if is_news else '❌ NO'}")
         
-        for channel_name in channels:
-            print(f"\n📺 ANALYZING CHANNEL: {channel_name}")
-            print("=" * 60)
+        if is_news:
+            news_detected_count += 1
+            
+            if verbose:
+                # Get category and score
+                category = detector.get_news_category(message.text)
+                score = detector.get_relevance_score(message.text)
+                out(f"   💰 Category: {category}")
+                out(f"   📈 Raw Score: {score}")
             
+            # Step 2: Relevance filtering
             try:
-                # Get channel entity
-                channel_username = f"@{channel_name}"
-                channel_entity = await client_manager.client.get_entity(channel_username)
+                is_relevant, filter_score, topics = NewsFilter.is_relevant_news(message.text)
                 
-                print(f"✅ Connected to {channel_username}")
-                print(f"📊 Channel Title: {getattr(channel_entity, 'title', 'Unknown')}")
-                print(f"👥 Members: {getattr(channel_entity, 'participants_count', 'Unknown')}")
+                if is_relevant:
+                    relevant_count += 1
                 
-                # Get recent messages - Check last 24 hours instead of 3
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                message_count = 0
-                processed_count = 0
-                news_detected_count = 0
-                relevant_count = 0
-                
-                print(f"\n📥 Analyzing last 50 messages (last 24 hours)")
-                print("-" * 40)
-                
-                async for message in client_manager.client.iter_messages(channel_entity, limit=50):
-                    message_count += 1
-                    
-                    # Check message age
-                    message_age_hours = (datetime.now() - message.date.replace(tzinfo=None)).total_seconds() / 3600
-                    
-                    print(f"\n📝 MESSAGE {message_count} (ID: {message.id})")
-                    print(f"🕐 Age: {message_age_hours:.1f} hours ago")
-                    print(f"📏 Length: {len(message.text) if message.text else 0} chars")
-                    
-                    # Skip if no text
-                    if not message.text:
-                        print("❌ SKIPPED: No text content")
-                        continue
-                    
-                    # Skip if too short
-                    if len(message.text.strip()) < 30:
-                        print("❌ SKIPPED: Too short (< 30 chars)")
-                        continue
-                    
-                    # Skip if too old (only for the 3-hour filter the bot uses)
-                    if message.date.replace(tzinfo=None) < cutoff_time:
-                        print("⏰ WOULD BE SKIPPED: Outside 3-hour window (bot filter)")
-                    
-                    processed_count += 1
+                if verbose:
+                    priority = NewsFilter.get_priority_level(filter_score)
                     
-                    # Show message preview
-                    preview = message.text[:150].replace('\n', ' ')
-                    print(f"📄 Preview: {preview}...")
+                    out(f"   🎯 Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
+                    out(f"   📊 Filter Score: {filter_score}")
+                    out(f"   ⚡ Priority: {priority}")
+                    out(f"   🏷️ Topics: {', '.join(topics[:5])}")
                     
-                    # Test financial news detection
-                    print("\n🔍 DETECTION ANALYSIS:")
-                    
-                    # Step 1: Basic news detection
-                    is_news = detector.is_news(message.text)
-                    print(f"   📊 Is News: {'✅ YES' if is_news else '❌ NO'}")
-                    
-                    if is_news:
-                        news_detected_count += 1
-                        
-                        # Get category and score
-                        category = detector.get_news_category(message.text)
-                        score = detector.get_relevance_score(message.text)
-                        print(f"   💰 Category: {category}")
-                        print(f"   📈 Raw Score: {score}")
-                        
-                        # Step 2: Relevance filtering
-                        try:
-                            is_relevant, filter_score, topics = NewsFilter.is_relevant_news(message.text)
-                            priority = NewsFilter.get_priority_level(filter_score)
-                            
-                            print(f"   🎯 Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
-                            print(f"   📊 Filter Score: {filter_score}")
-                            print(f"   ⚡ Priority: {priority}")
-                            print(f"   🏷️ Topics: {', '.join(topics[:5])}")
-                            
-                            if is_relevant:
-                                relevant_count += 1
-                                print("   🎉 WOULD BE SENT FOR APPROVAL!")
-                            else:
-                                print("   🚫 FILTERED OUT - Not relevant enough")
-                                
-                        except Exception as e:
-                            print(f"   ❌ Filter Error: {e}")
+                    if is_relevant:
+                        out("   🎉 WOULD BE SENT FOR APPROVAL!")
                     else:
-                        print("   🚫 FILTERED OUT - Not detected as news")
-                        
-                        # Show why it wasn't detected
-                        text_lower = message.text.lower()
-                        
-                        # Check for financial keywords
-                        financial_keywords = ["طلا", "سکه", "دلار", "یورو", "ارز", "نرخ", "قیمت", "بازار"]
-                        found_financial = [kw for kw in financial_keywords if kw in text_lower]
-                        if found_financial:
-                            print(f"   💡 Found financial keywords: {found_financial}")
-                        
-                        # Check for war keywords
-                        war_keywords = ["جنگ", "حمله", "ایران", "اسرائیل", "تحریم"]
-                        found_war = [kw for kw in war_keywords if kw in text_lower]
-                        if found_war:
-                            print(f"   💡 Found war keywords: {found_war}")
+                        out("   🚫 FILTERED OUT - Not relevant enough")
                     
-                    print("-" * 40)
-                
-                print(f"\n📊 CHANNEL SUMMARY: {channel_name}")
-                print("=" * 40)
-                print(f"📥 Total Messages: {message_count}")
-                print(f"📝 Processed (>30 chars): {processed_count}")
-                print(f"📰 News Detected: {news_detected_count}")
-                print(f"🎯 Relevant News: {relevant_count}")
-                print(f"📈 Detection Rate: {(news_detected_count/processed_count*100):.1f}%" if processed_count > 0 else "N/A")
-                print(f"🎯 Relevance Rate: {(relevant_count/news_detected_count*100):.1f}%" if news_detected_count > 0 else "N/A")
-                
             except Exception as e:
-                print(f"❌ Error analyzing {channel_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                out(f"   ❌ Filter Error (message {message.id}): {e}")
+        elif verbose:
+            out("   🚫 FILTERED OUT - Not detected as news")
+            
+            # Show why it wasn't detected
+            text_lower = message.text.lower()
+            
+            # Check for financial keywords
+            financial_keywords = ["طلا", "سکه", "دلار", "یورو", "ارز", "نرخ", "قیمت", "بازار"]
+            found_financial = [kw for kw in financial_keywords if kw in text_lower]
+            if found_financial:
+                out(f"   💡 Found financial keywords: {found_financial}")
+            
+            # Check for war keywords
+            war_keywords = ["جنگ", "حمله", "ایران", "اسرائیل", "تحریم"]
+            found_war = [kw for kw in war_keywords if kw in text_lower]
+            if found_war:
+                out(f"   💡 Found war keywords: {found_war}")
+        
+        if verbose:
+            out("-" * 40)
+    
+    out(f"\n📊 CHANNEL SUMMARY: {channel_name}")
+    out("=" * 40)
+    out(f"📥 Total Messages: {message_count}")
+    out(f"📝 Processed (>30 chars): {processed_count}")
+    out(f"📰 News Detected: {news_detected_count}")
+    out(f"🎯 Relevant News: {relevant_count}")
+    out(f"📈 Detection Rate: {(news_detected_count/processed_count*100):.1f}%" if processed_count > 0 else "N/A")
+    out(f"🎯 Relevance Rate: {(relevant_count/news_detected_count*100):.1f}%" if news_detected_count > 0 else "N/A")
+    
+    return channel_name, message_count, news_detected_count, report
+
+async def debug_channel_messages(detector):
+    """Debug what messages are in the channels and why they're being filtered."""
+    
+    print("🔍 DETAILED CHANNEL MESSAGE ANALYSIS")
+    print("=" * 80)
+    
+    # Reuse the process-wide client; main() stops it on exit
+    try:
+        client_manager = await get_shared_client()
+    except Exception as e:
+        print(f"❌ Failed to start Telegram client: {e}")
+        return
+    
+    # Check last 24 hours instead of 3; one cutoff for the whole scan
+    cutoff_ts = time.time() - 24 * 3600
+    
+    # Check both channels concurrently; one failing channel doesn't cancel the other
+    results = await asyncio.gather(
+        *(scan_channel(client_manager, detector, channel_name, cutoff_ts)
+          for channel_name in CHANNELS),
+        return_exceptions=True
+    )
+    
+    total_messages = 0
+    total_news = 0
+    
+    for channel_name, result in zip(CHANNELS, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error analyzing {channel_name}: {result}")
+            traceback.print_exception(type(result), result, result.__traceback__)
+            continue
         
-    finally:
-        await client_manager.stop()
+        _, message_count, news_detected_count, report = result
+        total_messages += message_count
+        total_news += news_detected_count
+        sys.stdout.write("\n".join(report) + "\n")
+    
+    print(f"\n📊 ALL CHANNELS: {total_messages} messages, {total_news} detected as news")
 
-async def test_sample_messages():
+async def test_sample_messages(detector):
     """Test detection on sample gold/financial messages."""
     
-    print("\n🧪 TESTING SAMPLE FINANCIAL MESSAGES")
-    print("=" * 50)
+    log.info("\n🧪 TESTING SAMPLE FINANCIAL MESSAGES")
+    log.info("=" * 50)
     
-    detector = NewsDetector()
+    detected_count = 0
+    relevant_count = 0
     
-    # Sample messages that should be detected
-    test_messages = [
-        "قیمت طلای ۱۸ عیار امروز ۲ میلیون و ۵۰۰ هزار تومان اعلام شد",
-        "نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید",
-        "سکه طلا امروز با افزایش ۱۰۰ هزار تومانی همراه بود",
-        "بازار ارز امروز با نوسان شدیدی همراه بود",
-        "یورو در مقابل تومان به ۵۵ هزار تومان رسید",
-        "بورس تهران امروز با رشد ۲ درصدی بسته شد",
-        "تحریم های جدید آمریکا بر اقتصاد ایران تاثیر گذاشت",
-        "تحلیل بازار طلا: انتظار افزایش قیمت تا پایان هفته",
-        "شاخص دلار جهانی امروز کاهش یافت",
-        "قیمت نفت برنت به ۷۰ دلار رسید"
-    ]
-    
-    for i, text in enumerate(test_messages, 1):
-        print(f"\n🧪 TEST {i}: {text}")
+    for i, text in enumerate(SAMPLE_MESSAGES, 1):
+        log.info(f"\n🧪 TEST {i}: {text}")
         
         is_news = detector.is_news(text)
-        print(f"📊 Detection: {'✅ YES' if is_news else '❌ NO'}")
+        log.info(f"📊 Detection: {'✅ YES' if is_news else '❌ NO'}")
         
-        if is_news:
-            category = detector.get_news_category(text)
-            score = detector.get_relevance_score(text)
-            print(f"💰 Category: {category}")
-            print(f"📈 Score: {score}")
+        if not is_news:
+            log.warning(f"❌ Sample {i} not detected as news: {text}")
+        else:
+            detected_count += 1
+            
+            if log.isEnabledFor(logging.INFO):
+                category = detector.get_news_category(text)
+                score = detector.get_relevance_score(text)
+                log.info(f"💰 Category: {category}")
+                log.info(f"📈 Score: {score}")
             
             try:
                 is_relevant, filter_score, topics = NewsFilter.is_relevant_news(text)
                 priority = NewsFilter.get_priority_level(filter_score)
-                print(f"🎯 Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
-                print(f"📊 Filter Score: {filter_score}")
-                print(f"⚡ Priority: {priority}")
-                print(f"🏷️ Topics: {', '.join(topics[:3])}")
+                log.info(f"🎯 Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
+                log.info(f"📊 Filter Score: {filter_score}")
+                log.info(f"⚡ Priority: {priority}")
+                log.info(f"🏷️ Topics: {', '.join(topics[:3])}")
+                
+                if is_relevant:
+                    relevant_count += 1
+                else:
+                    log.warning(f"⚠️ Sample {i} detected but not relevant (score: {filter_score}): {text}")
             except Exception as e:
-                print(f"❌ Filter Error: {e}")
+                log.error(f"❌ Sample {i} Filter Error: {e}")
         
-        print("-" * 30)
+        log.info("-" * 30)
+    
+    total = len(SAMPLE_MESSAGES)
+    print(f"\n📊 SAMPLES: {detected_count}/{total} detected, {relevant_count}/{total} relevant")
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Debug financial news detection.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="show per-message detail")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--no-channel", action="store_true",
+                       help="only test the sample messages; don't start a Telegram client")
+    group.add_argument("--channels-only", action="store_true",
+                       help="only analyze the channels; skip the sample messages")
+    return parser.parse_args(argv)
 
-async def main():
+async def main(args):
     """Main debug function."""
     print("🚀 FINANCIAL NEWS DETECTION DEBUG TOOL")
     print("=" * 80)
     
+    # One detector is shared by the sample and channel analyses
+    detector = NewsDetector()
+    
     # Test sample messages first
-    await test_sample_messages()
+    if not args.channels_only:
+        await test_sample_messages(detector)
     
     # Then analyze actual channels
-    await debug_channel_messages()
+    if not args.no_channel:
+        try:
+            await debug_channel_messages(detector)
+        finally:
+            await stop_shared_client()
     
     print("\n✅ DEBUG ANALYSIS COMPLETE!")
     print("\n💡 RECOMMENDATIONS:")
@@ -223,4 +321,13 @@ async def main():
     print("3. Check your .env settings - WAR_NEWS_ONLY should be false for financial news")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    
+    # Per-message detail is logged at INFO and only shown with --verbose
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
+    
+    with asyncio.Runner() as runner:
+        runner.run(main(args))
\ No newline at end of file
@@ -12,107 +12,99 @@ from datetime import datetime, timedelta
 project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
-from src.client.telegram_client import TelegramClientManager
+from src.client.telegram_client import get_shared_client, stop_shared_client
 from src.services.news_detector import NewsDetector
 from src.services.news_filter import NewsFilter
 
-async def debug_test_messages():
+async def debug_test_messages(detector):
     """Test messages with detailed debug output."""
     
     print("🔍 DEBUG TEST - Recent Messages Analysis")
     print("=" * 60)
     
-    # Create client and detector
-    client_manager = TelegramClientManager()
-    detector = NewsDetector()
+    # Reuse the process-wide client; main() stops it on exit
+    try:
+        client_manager = await get_shared_client()
+    except Exception as e:
+        print(f"❌ Failed to start Telegram client: {e}")
+        return
+    
+    # Test goldonline2016 channel
+    channel_name = "goldonline2016"
+    channel_username = f"@{channel_name}"
+    
+    print(f"📺 Testing channel: {channel_username}")
     
     try:
-        # Start client
-        if not await client_manager.start():
-            print("❌ Failed to start Telegram client")
-            return
+        channel_entity = await client_manager.client.get_entity(channel_username)
+        print(f"✅ Connected to {channel_username}")
         
-        # Test goldonline2016 channel
-        channel_name = "goldonline2016"
-        channel_username = f"@{channel_name}"
+        # Get last 10 messages
+        message_count = 0
         
-        print(f"📺 Testing channel: {channel_username}")
-        
-        try:
-            channel_entity = await client_manager.client.get_entity(channel_username)
-            print(f"✅ Connected to {channel_username}")
+        async for message in client_manager.client.iter_messages(channel_entity, limit=10):
+            message_count += 1
             
-            # Get last 10 messages
-            message_count = 0
+            print(f"\n📝 MESSAGE {message_count} (ID: {message.id})")
+            print(f"🕐 Date: {message.date}")
+            print(f"📏 Length: {len(message.text) if message.text else 0} chars")
             
-            async for message in client_manager.client.iter_messages(channel_entity, limit=10):
-                message_count += 1
-                
-                print(f"\n📝 MESSAGE {message_count} (ID: {message.id})")
-                print(f"🕐 Date: {message.date}")
-                print(f"📏 Length: {len(message.text) if message.text else 0} chars")
-                
-                if not message.text or len(message.text.strip()) < 30:
-                    print("❌ SKIPPED: No text or too short")
-                    continue
-                
-                # Show message preview
-                preview = message.text[:200].replace('\n', ' ')
-                print(f"📄 Preview: {preview}...")
-                
-                # Test news detection (bypass filters)
-                print("\n🔍 DETAILED ANALYSIS:")
-                
-                # Step 1: Basic news detection
-                is_news = detector.is_news(message.text)
-                print(f"   📊 Basic News Detection: {'✅ YES' if is_news else '❌ NO'}")
+            if not message.text or len(message.text.strip()) < 30:
+                print("❌ SKIPPED: No text or too short")
+                continue
+            
+            # Show message preview
+            preview = message.text[:200].replace('\n', ' ')
+            print(f"📄 Preview: {preview}...")
+            
+            # Test news detection (bypass filters)
+            print("\n🔍 DETAILED ANALYSIS:")
+            
+            # Step 1: Basic news detection
+            is_news = detector.is_news(message.text)
+            print(f"   📊 Basic News Detection: {'✅ YES' if is_news else '❌ NO'}")
+            
+            if is_news:
+                # Get category and score
+                category = detector.get_news_category(message.text)
+                score = detector.get_relevance_score(message.text)
+                print(f"   💰 Category: {category}")
+                print(f"   📈 Detector Score: {score}")
                 
-                if is_news:
-                    # Get category and score
-                    category = detector.get_news_category(message.text)
-                    score = detector.get_relevance_score(message.text)
-                    print(f"   💰 Category: {category}")
-                    print(f"   📈 Detector Score: {score}")
+                # Test NewsFilter
+                try:
+                    is_relevant, filter_score, topics = NewsFilter.is_relevant_news(message.text)
+                    priority = NewsFilter.get_priority_level(filter_score)
                     
-                    # Test NewsFilter
-                    try:
-                        is_relevant, filter_score, topics = NewsFilter.is_relevant_news(message.text)
-                        priority = NewsFilter.get_priority_level(filter_score)
-                        
-                        print(f"   🎯 NewsFilter Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
-                        print(f"   📊 NewsFilter Score: {filter_score}")
-                        print(f"   ⚡ Priority: {priority}")
-                        print(f"   🏷️ Topics: {', '.join(topics[:5])}")
+                    print(f"   🎯 NewsFilter Relevant: {'✅ YES' if is_relevant else '❌ NO'}")
+                    print(f"   📊 NewsFilter Score: {filter_score}")
+                    print(f"   ⚡ Priority: {priority}")
+                    print(f"   🏷️ Topics: {', '.join(topics[:5])}")
+                    
+                    # Show why it was filtered
+                    if not is_relevant:
+                        print(f"   🚫 FILTERED: Score {filter_score} too low")
+                    else:
+                        print(f"   ✅ WOULD BE APPROVED!")
                         
-                        # Show why it was filtered
-                        if not is_relevant:
-                            print(f"   🚫 FILTERED: Score {filter_score} too low")
-                        else:
-                            print(f"   ✅ WOULD BE APPROVED!")
-                            
-                    except Exception as e:
-                        print(f"   ❌ Filter Error: {e}")
-                
-                print("-" * 40)
-                
-                # Stop after first few for readability
-                if message_count >= 5:
-                    break
+                except Exception as e:
+                    print(f"   ❌ Filter Error: {e}")
+            
+            print("-" * 40)
             
-        except Exception as e:
-            print(f"❌ Error testing channel: {e}")
+            # Stop after first few for readability
+            if message_count >= 5:
+                break
         
-    finally:
-        await client_manager.stop()
+    except Exception as e:
+        print(f"❌ Error testing channel: {e}")
 
-async def test_with_sample_text():
+async def test_with_sample_text(detector):
     """Test with known financial text samples."""
     
     print("\n🧪 TESTING WITH SAMPLE FINANCIAL TEXTS")
     print("=" * 50)
     
-    detector = NewsDetector()
-    
     # Test messages that should definitely work
     test_messages = [
         "قیمت طلای ۱۸ عیار امروز ۲.۵ میلیون تومان اعلام شد",
@@ -149,11 +141,17 @@ async def main():
     print("🚀 FINANCIAL NEWS DEBUG TEST")
     print("=" * 80)
     
+    # One detector is shared by both tests
+    detector = NewsDetector()
+    
     # Test sample texts first
-    await test_with_sample_text()
+    await test_with_sample_text(detector)
     
     # Then test actual channel messages
-    await debug_test_messages()
+    try:
+        await debug_test_messages(detector)
+    finally:
+        await stop_shared_client()
     
     print("\n✅ DEBUG TEST COMPLETE!")
     print("\n💡 If sample texts work but channel messages don't:")
@@ -28,27 +28,31 @@ BENCHMARK_TEXTS = [
 ]
 
 
-def benchmark_detection_speed():
+# Untimed passes over the full timed workload before each benchmark, so
+# first-call costs (regex compilation, keyword automaton, cold caches) are
+# excluded from the reported steady-state numbers
+WARMUP_ITERATIONS = 2
+
+
+def benchmark_detection_speed(detector):
     """Benchmark news detection speed."""
     print("⚡ Benchmarking News Detection Speed")
     print("-" * 40)
     
-    detector = NewsDetector()
-    
-    # Warm up
-    for text in BENCHMARK_TEXTS[:2]:
-        detector.is_news(text)
+    # Warm up on the same workload as the timed loop
+    for _ in range(WARMUP_ITERATIONS):
+        detector.is_news_batch(BENCHMARK_TEXTS)
     
     # Benchmark detection
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     iterations = 1000
     
+    # One batched call per iteration over all benchmark texts
     for i in range(iterations):
-        for text in BENCHMARK_TEXTS:
-            detector.is_news(text)
+        detector.is_news_batch(BENCHMARK_TEXTS)
     
-    end_time = time.time()
-    total_time = end_time - start_time
+    end_ns = time.perf_counter_ns()
+    total_time = (end_ns - start_ns) / 1e9
     avg_time_per_detection = (total_time / (iterations * len(BENCHMARK_TEXTS))) * 1000
     
     print(f"Total detections: {iterations * len(BENCHMARK_TEXTS)}")
@@ -62,20 +66,20 @@ def benchmark_filtering_speed():
     print("\n⚡ Benchmarking News Filtering Speed")
     print("-" * 40)
     
-    # Warm up
-    for text in BENCHMARK_TEXTS[:2]:
-        NewsFilter.is_relevant_news(text)
+    # Warm up on the same workload as the timed loop
+    for _ in range(WARMUP_ITERATIONS):
+        NewsFilter.is_relevant_news_batch(BENCHMARK_TEXTS)
     
     # Benchmark filtering
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     iterations = 1000
     
+    # One batched call per iteration over all benchmark texts
     for i in range(iterations):
-        for text in BENCHMARK_TEXTS:
-            NewsFilter.is_relevant_news(text)
+        NewsFilter.is_relevant_news_batch(BENCHMARK_TEXTS)
     
-    end_time = time.time()
-    total_time = end_time - start_time
+    end_ns = time.perf_counter_ns()
+    total_time = (end_ns - start_ns) / 1e9
     avg_time_per_filter = (total_time / (iterations * len(BENCHMARK_TEXTS))) * 1000
     
     print(f"Total filterings: {iterations * len(BENCHMARK_TEXTS)}")
@@ -84,27 +88,26 @@ def benchmark_filtering_speed():
     print(f"Filterings per second: {(iterations * len(BENCHMARK_TEXTS)) / total_time:.0f}")
 
 
-def benchmark_text_cleaning():
+def benchmark_text_cleaning(detector):
     """Benchmark text cleaning speed."""
     print("\n⚡ Benchmarking Text Cleaning Speed")
     print("-" * 40)
     
-    detector = NewsDetector()
-    
-    # Warm up
-    for text in BENCHMARK_TEXTS[:2]:
-        detector.clean_news_text(text)
+    # Warm up on the same workload as the timed loop
+    for _ in range(WARMUP_ITERATIONS):
+        for text in BENCHMARK_TEXTS:
+            detector.clean_news_text(text)
     
     # Benchmark cleaning
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     iterations = 1000
     
     for i in range(iterations):
         for text in BENCHMARK_TEXTS:
             detector.clean_news_text(text)
     
-    end_time = time.time()
-    total_time = end_time - start_time
+    end_ns = time.perf_counter_ns()
+    total_time = (end_ns - start_ns) / 1e9
     avg_time_per_clean = (total_time / (iterations * len(BENCHMARK_TEXTS))) * 1000
     
     print(f"Total cleanings: {iterations * len(BENCHMARK_TEXTS)}")
@@ -113,28 +116,21 @@ def benchmark_text_cleaning():
     print(f"Cleanings per second: {(iterations * len(BENCHMARK_TEXTS)) / total_time:.0f}")
 
 
-def test_accuracy():
+def test_accuracy(detector):
     """Test detection and filtering accuracy."""
     print("\n🎯 Testing Detection Accuracy")
     print("-" * 40)
     
-    detector = NewsDetector()
-    
     # All benchmark texts should be detected as news
-    correct_detections = 0
-    for text in BENCHMARK_TEXTS:
-        if detector.is_news(text):
-            correct_detections += 1
+    correct_detections = sum(detector.is_news_batch(BENCHMARK_TEXTS))
     
     detection_accuracy = (correct_detections / len(BENCHMARK_TEXTS)) * 100
     print(f"News detection accuracy: {detection_accuracy:.1f}% ({correct_detections}/{len(BENCHMARK_TEXTS)})")
     
     # All benchmark texts should be relevant
-    relevant_detections = 0
-    for text in BENCHMARK_TEXTS:
-        is_relevant, score, topics = NewsFilter.is_relevant_news(text)
-        if is_relevant:
-            relevant_detections += 1
+    relevant_detections = sum(
+        is_relevant for is_relevant, _, _ in NewsFilter.is_relevant_news_batch(BENCHMARK_TEXTS)
+    )
     
     relevance_accuracy = (relevant_detections / len(BENCHMARK_TEXTS)) * 100
     print(f"Relevance filtering accuracy: {relevance_accuracy:.1f}% ({relevant_detections}/{len(BENCHMARK_TEXTS)})")
@@ -145,10 +141,13 @@ def main():
     print("🏁 News Detector Performance Benchmark")
     print("=" * 50)
     
-    benchmark_detection_speed()
+    # One detector is shared by all benchmarks
+    detector = NewsDetector()
+    
+    benchmark_detection_speed(detector)
     benchmark_filtering_speed()
-    benchmark_text_cleaning()
-    test_accuracy()
+    benchmark_text_cleaning(detector)
+    test_accuracy(detector)
     
     print("\n✅ Benchmark complete!")
 
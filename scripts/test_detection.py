@@ -9,7 +9,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.client.telegram_client import TelegramClientManager
+from src.client.telegram_client import get_shared_client, stop_shared_client
 from src.handlers.news_handler import NewsHandler
 from config.credentials import validate_credentials
 
@@ -22,11 +22,8 @@ async def test_channel_processing(channel_name):
         # Validate credentials
         validate_credentials()
         
-        # Initialize client
-        client_manager = TelegramClientManager()
-        if not await client_manager.start():
-            print("Failed to start Telegram client")
-            return
+        # Reuse the process-wide client; main() stops it on exit
+        client_manager = await get_shared_client()
         
         # Initialize news handler
         news_handler = NewsHandler(client_manager)
@@ -41,9 +38,6 @@ async def test_channel_processing(channel_name):
         else:
             print(f"❌ No news found or processed from {channel_name}")
         
-        # Stop client
-        await client_manager.stop()
-        
     except Exception as e:
         print(f"Error: {e}")
 
@@ -51,10 +45,13 @@ async def test_channel_processing(channel_name):
 async def main():
     """Main test function."""
     if len(sys.argv) > 1:
-        channel = sys.argv[1]
-        await test_channel_processing(channel)
+        try:
+            for channel in sys.argv[1:]:
+                await test_channel_processing(channel)
+        finally:
+            await stop_shared_client()
     else:
-        print("Usage: python test_detection.py <channel_username>")
+        print("Usage: python test_detection.py <channel_username> [<channel_username> ...]")
         print("Example: python test_detection.py goldonline2016")
 
 
@@ -509,6 +509,42 @@ async def create_client(session_name=None, use_string_session=False):
     else:
         raise Exception("Failed to start Telegram client")
 
+# Process-wide client shared by the debug and test scripts
+_shared_client = None
+_shared_client_lock = asyncio.Lock()
+
+async def get_shared_client():
+    """
+    Get the process-wide Telegram client, starting it on first use.
+    
+    Scripts that touch Telegram from several places reuse one connected
+    session instead of paying for a connect and auth round-trip each time.
+    Call stop_shared_client() once when done.
+    
+    Returns:
+        TelegramClientManager: Started client manager
+    """
+    global _shared_client
+    
+    async with _shared_client_lock:
+        if _shared_client is None or not _shared_client.is_connected():
+            if _shared_client is not None:
+                # Release the stale session and its monitor tasks first
+                await _shared_client.stop()
+                _shared_client = None
+            _shared_client = await create_client()
+        return _shared_client
+
+async def stop_shared_client():
+    """Stop the process-wide Telegram client if it was started."""
+    global _shared_client
+    
+    async with _shared_client_lock:
+        client_manager, _shared_client = _shared_client, None
+    
+    if client_manager is not None:
+        await client_manager.stop()
+
 async def test_connection():
     """Test Telegram connection."""
     logger.info("🧪 Testing Telegram connection...")
@@ -531,5 +567,7 @@ async def test_connection():
 __all__ = [
     'TelegramClientManager',
     'create_client',
+    'get_shared_client',
+    'stop_shared_client',
     'test_connection'
 ]
\ No newline at end of file
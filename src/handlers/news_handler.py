@@ -167,8 +167,15 @@ class NewsHandler:
             self.media_dir.mkdir(exist_ok=True)
             self.temp_media_dir.mkdir(exist_ok=True)
         
-        # Start periodic cleanup task
-        asyncio.create_task(self._periodic_cleanup_task())
+        # Start periodic cleanup task; without a running loop (e.g. when
+        # built in a unit test) initialize() starts it instead
+        self.cleanup_task = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self.cleanup_task = asyncio.create_task(self._periodic_cleanup_task())
         
         logger.info("📰 Complete News Handler initialized with all features")
 
@@ -178,6 +185,9 @@ class NewsHandler:
             # Initialize Bot API
             self.bot_api = BotAPIClient()
             
+            if self.cleanup_task is None:
+                self.cleanup_task = asyncio.create_task(self._periodic_cleanup_task())
+            
             # Start periodic media cleanup if enabled
             if MEDIA_SUPPORT and ENABLE_MEDIA_PROCESSING:
                 asyncio.create_task(self._periodic_media_cleanup())
@@ -871,21 +881,23 @@ class NewsHandler:
                     
                     logger.debug(f"📝 Analyzing message {message.id}: {message.text[:100]}...")
                     
-                    # Enhanced financial news detection
-                    if not self.news_detector.is_news(message.text):
+                    # Enhanced financial news detection and relevance filtering in
+                    # one cached pass; messages that were filtered out are seen
+                    # again every cycle and reposts recur across channels
+                    try:
+                        is_news, is_relevant, score, topics = self.news_detector.classify(message.text)
+                    except Exception as filter_error:
+                        logger.warning(f"NewsFilter error: {filter_error}, assuming relevant")
+                        is_news = self.news_detector.is_news(message.text)
+                        is_relevant, score, topics = True, 5, ["fallback"]
+                    
+                    if not is_news:
                         logger.debug(f"Message {message.id} not detected as financial news")
                         continue
                     
                     logger.info(f"📰 Financial news detected in message {message.id}")
                     self.stats['news_detected'] += 1
                     
-                    # Enhanced relevance filtering with lower thresholds
-                    try:
-                        is_relevant, score, topics = NewsFilter.is_relevant_news(message.text)
-                    except Exception as filter_error:
-                        logger.warning(f"NewsFilter error: {filter_error}, assuming relevant")
-                        is_relevant, score, topics = True, 5, ["fallback"]
-                    
                     if not is_relevant:
                         logger.info(f"Message {message.id} filtered out (financial score: {score})")
                         self.stats['news_filtered_out'] += 1
@@ -969,6 +981,18 @@ class NewsHandler:
             self.stats['errors'] += 1
             return False
 
+    def split_news_segments(self, text):
+        """
+        Split a combined post into its news segments.
+        
+        Uses the same separators as NewsDetector.split_combined_news, without
+        its minimum segment length; a post without separators comes back as
+        a single segment.
+        """
+        if not text:
+            return []
+        return self.news_detector.split_on_separators(text)
+
     def _extract_media_info(self, message, channel_username):
         """Extract comprehensive media information from message."""
         try:
@@ -1277,14 +1301,15 @@ class NewsHandler:
                     logger.info(f"📝 Force processing message {message.id}: {message.text[:100]}...")
                     
                     # Force process regardless of previous processing
-                    if self.news_detector.is_news(message.text):
+                    try:
+                        is_news, is_relevant, score, topics = self.news_detector.classify(message.text)
+                    except:
+                        is_news = self.news_detector.is_news(message.text)
+                        is_relevant, score, topics = True, 3, ["force_test"]
+                    
+                    if is_news:
                         logger.info(f"   📰 Financial news detected: True")
                         
-                        try:
-                            is_relevant, score, topics = NewsFilter.is_relevant_news(message.text)
-                        except:
-                            is_relevant, score, topics = True, 3, ["force_test"]
-                        
                         logger.info(f"   🎯 Relevance: {is_relevant}, Score: {score}, Topics: {topics[:3]}")
                         
                         if is_relevant:
@@ -4,9 +4,22 @@ Optimized for detecting financial news from Iranian gold/currency channels.
 """
 import logging
 import re
+from collections import OrderedDict
+
+from src.services.news_filter import NewsFilter
+from src.utils.text_utils import normalize_text
 
 logger = logging.getLogger(__name__)
 
+# Cleaning and splitting patterns, compiled once at import
+_RE_HANDLE = re.compile(r'@\w+')
+_RE_URL = re.compile(r'https?://\S+')
+_RE_EMOJI_RUN = re.compile(r'[\U0001F300-\U0001FAFF\u2600-\u27BF\uFE0F]{3,}')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_NUMBERED_ITEM = re.compile(r'\d+[\.\)]\s')
+# Runs of news separators (---, ===, ***, ...) with their surrounding whitespace
+_RE_SEGMENT_SEPARATOR = re.compile(r'\s*(?:-{3,}|={3,}|\*{3,}|░{3,}|◦{3,}|━{3,}|▬{3,}|(?:▫️){2,})\s*')
+
 class NewsDetector:
     """Enhanced news detector optimized for financial and economic content."""
     
@@ -111,13 +124,22 @@ class NewsDetector:
         "beauty", "health", "medical", "travel", "tourism", "animals"
     ]
 
+    # Bound on classify() results remembered per detector
+    CLASSIFY_CACHE_SIZE = 1024
+
+    def __init__(self):
+        """Initialize the detector with an empty classification cache."""
+        self._classify_cache = OrderedDict()
+
     def is_news(self, text):
         """Enhanced news detection for financial content."""
         if not text or len(text.strip()) < 30:
             return False
         
-        text_lower = text.lower()
-        
+        return self._is_news_lower(normalize_text(text))
+
+    def _is_news_lower(self, text_lower):
+        """Score text already passed through normalize_text for is_news."""
         # Calculate scores for different categories
         gold_score = self._calculate_keyword_score(text_lower, self.GOLD_KEYWORDS, 3)
         currency_score = self._calculate_keyword_score(text_lower, self.CURRENCY_KEYWORDS, 3) 
@@ -153,6 +175,47 @@ class NewsDetector:
         
         return is_relevant
 
+    def is_news_batch(self, texts):
+        """Run is_news over a batch of texts, returning a list of booleans."""
+        is_news = self.is_news
+        return [is_news(text) for text in texts]
+
+    def classify(self, text):
+        """
+        Detect and filter text in a single pass.
+        
+        The text is normalized once and shared by the detector and
+        NewsFilter; the relevance filter only runs on texts detected as news.
+        Results are cached by normalized text, so the same story reposted
+        across channels is only scored once.
+        
+        Returns:
+            tuple: (is_news, is_relevant, relevance_score, matching_topics)
+        """
+        if not text or len(text.strip()) < 30:
+            return False, False, 0, []
+        
+        text_lower = normalize_text(text)
+        cache = self._classify_cache
+        
+        result = cache.get(text_lower)
+        if result is not None:
+            cache.move_to_end(text_lower)
+        else:
+            if not self._is_news_lower(text_lower):
+                result = (False, False, 0, ())
+            else:
+                is_relevant, relevance_score, matching_topics = NewsFilter._evaluate_relevance(text_lower)
+                result = (True, is_relevant, relevance_score, tuple(matching_topics))
+            
+            cache[text_lower] = result
+            if len(cache) > self.CLASSIFY_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        # Hand out a fresh topics list so callers can't alter the cached entry
+        is_news, is_relevant, relevance_score, matching_topics = result
+        return is_news, is_relevant, relevance_score, list(matching_topics)
+
     def _calculate_keyword_score(self, text_lower, keywords, multiplier):
         """Calculate score for a keyword category."""
         return sum(multiplier for kw in keywords if kw in text_lower)
@@ -162,7 +225,7 @@ class NewsDetector:
         if not text:
             return "unknown"
         
-        text_lower = text.lower()
+        text_lower = normalize_text(text)
         
         # Count matches in each category
         categories = {
@@ -183,7 +246,7 @@ class NewsDetector:
         if not text:
             return 0
         
-        text_lower = text.lower()
+        text_lower = normalize_text(text)
         
         gold_score = self._calculate_keyword_score(text_lower, self.GOLD_KEYWORDS, 3)
         currency_score = self._calculate_keyword_score(text_lower, self.CURRENCY_KEYWORDS, 3)
@@ -206,9 +269,10 @@ class NewsDetector:
         
         # Basic cleaning
         cleaned = text.strip()
-        cleaned = re.sub(r'@\w+', '', cleaned)  # Remove handles
-        cleaned = re.sub(r'https?://\S+', '', cleaned)  # Remove URLs
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
+        cleaned = _RE_HANDLE.sub('', cleaned)  # Remove handles
+        cleaned = _RE_URL.sub('', cleaned)  # Remove URLs
+        cleaned = _RE_EMOJI_RUN.sub('', cleaned)  # Remove emoji runs
+        cleaned = _RE_WHITESPACE.sub(' ', cleaned).strip()  # Normalize whitespace
         
         # Add appropriate emoji based on content
         if not self._has_financial_emoji(cleaned):
@@ -224,7 +288,7 @@ class NewsDetector:
 
     def _get_financial_emoji(self, text):
         """Get appropriate financial emoji."""
-        text_lower = text.lower()
+        text_lower = normalize_text(text)
         
         if any(kw in text_lower for kw in self.GOLD_KEYWORDS):
             return "🏆"
@@ -237,22 +301,31 @@ class NewsDetector:
         else:
             return "📈"
 
+    @staticmethod
+    def split_on_separators(text):
+        """
+        Split text on news separators in a single pass.
+        
+        Returns:
+            list: Trimmed non-empty segments; text without separators
+                comes back as a single segment
+        """
+        segments = (segment.strip() for segment in _RE_SEGMENT_SEPARATOR.split(text))
+        return [segment for segment in segments if segment]
+
     def split_combined_news(self, text):
         """Split combined news messages into segments."""
         if not text:
             return [text]
         
         # Look for news separators
-        separators = ['---', '===', '***', '░░░', '▫️▫️', '◦◦◦', '━━━', '▬▬▬']
-        
-        for sep in separators:
-            if sep in text:
-                segments = [seg.strip() for seg in text.split(sep)]
-                return [seg for seg in segments if len(seg.strip()) >= 30]
+        segments = self.split_on_separators(text)
+        if segments != [text.strip()]:
+            return [seg for seg in segments if len(seg) >= 30]
         
         # Check for numbered items (1. 2. 3. etc.)
-        if re.search(r'\d+[\.\)]\s', text):
-            segments = re.split(r'\d+[\.\)]\s', text)
+        if _RE_NUMBERED_ITEM.search(text):
+            segments = _RE_NUMBERED_ITEM.split(text)
             segments = [seg.strip() for seg in segments if len(seg.strip()) >= 30]
             if len(segments) > 1:
                 return segments
@@ -5,6 +5,13 @@ Optimized for Iranian financial news with lower thresholds.
 import logging
 import re
 
+from src.utils.text_utils import normalize_text
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 class NewsFilter:
@@ -58,6 +65,21 @@ class NewsFilter:
         "index", "chart", "data", "statistics", "figure"
     ]
 
+    # NEWS STRUCTURE PATTERNS (compiled once at class load)
+    NEWS_STRUCTURE_PATTERNS = [
+        re.compile(r'اعلام\s+(شد|کرد)'),      # announced
+        re.compile(r'گزارش\s+می‌دهد'),       # reports
+        re.compile(r'بیان\s+داشت'),          # stated
+        re.compile(r'تأیید\s+کرد'),          # confirmed
+        re.compile(r'منابع\s+خبری'),         # news sources
+        re.compile(r'خبرگزاری'),             # news agency
+        re.compile(r'آژانس'),                # agency
+        re.compile(r'قیمت\s+.+\s+رسید'),     # price reached
+        re.compile(r'نرخ\s+.+\s+شد'),        # rate became
+        re.compile(r'بازار\s+.+\s+(بسته|باز)'), # market closed/opened
+        re.compile(r'\d+\s+(تومان|دلار|یورو)'), # numbers with currency
+    ]
+
     @classmethod
     def is_relevant_news(cls, text):
         """
@@ -69,36 +91,49 @@ class NewsFilter:
         if not text or len(text.strip()) < 30:
             return False, 0, []
         
-        text_lower = text.lower()
+        return cls._evaluate_relevance(normalize_text(text))
+
+    @classmethod
+    def _evaluate_relevance(cls, text_lower):
+        """
+        Score text whose normalized form has already been computed.
+        
+        Shared by is_relevant_news and NewsDetector.classify so the text is
+        only normalized once per message.
+        """
         matching_topics = []
         relevance_score = 0
         
+        # Either the set of keywords found in one automaton pass or, without
+        # pyahocorasick, the text itself; "kw in haystack" works for both
+        haystack = cls._find_keywords(text_lower)
+        
         # Critical financial keywords (score: 5 each - LOWERED from 10)
-        critical_matches = [kw for kw in cls.CRITICAL_FINANCIAL_KEYWORDS if kw in text_lower]
+        critical_matches = [kw for kw in cls.CRITICAL_FINANCIAL_KEYWORDS if kw in haystack]
         if critical_matches:
             relevance_score += len(critical_matches) * 5
             matching_topics.extend([f"FINANCIAL:{kw}" for kw in critical_matches[:3]])
         
         # High priority keywords (score: 3 each - LOWERED from 5)
-        high_matches = [kw for kw in cls.HIGH_PRIORITY_KEYWORDS if kw in text_lower]
+        high_matches = [kw for kw in cls.HIGH_PRIORITY_KEYWORDS if kw in haystack]
         if high_matches:
             relevance_score += len(high_matches) * 3
             matching_topics.extend([f"HIGH:{kw}" for kw in high_matches[:3]])
         
         # Geopolitical keywords (score: 2 each - SAME)
-        geo_matches = [kw for kw in cls.GEOPOLITICAL_KEYWORDS if kw in text_lower]
+        geo_matches = [kw for kw in cls.GEOPOLITICAL_KEYWORDS if kw in haystack]
         if geo_matches:
             relevance_score += len(geo_matches) * 2
             matching_topics.extend([f"GEO:{kw}" for kw in geo_matches[:2]])
         
         # Technical analysis keywords (score: 1 each)
-        tech_matches = [kw for kw in cls.TECHNICAL_KEYWORDS if kw in text_lower]
+        tech_matches = [kw for kw in cls.TECHNICAL_KEYWORDS if kw in haystack]
         if tech_matches:
             relevance_score += len(tech_matches) * 1
             matching_topics.extend([f"TECH:{kw}" for kw in tech_matches[:2]])
         
         # Bonus for news structure patterns
-        if cls._has_news_structure(text):
+        if cls._has_news_structure(text_lower):
             relevance_score += 2  # LOWERED from 5
             matching_topics.append("NEWS_STRUCTURE")
         
@@ -124,25 +159,33 @@ class NewsFilter:
         
         return is_relevant, relevance_score, matching_topics
 
+    @classmethod
+    def is_relevant_news_batch(cls, texts):
+        """
+        Run is_relevant_news over a batch of texts.
+        
+        Returns:
+            list: (is_relevant, relevance_score, matching_topics) per text
+        """
+        is_relevant_news = cls.is_relevant_news
+        return [is_relevant_news(text) for text in texts]
+
+    @classmethod
+    def _find_keywords(cls, text_lower):
+        """
+        Collect every scored keyword that occurs in text_lower.
+        
+        Uses a single Aho-Corasick scan when pyahocorasick is installed and
+        falls back to returning text_lower for plain substring checks.
+        """
+        if _KEYWORD_AUTOMATON is None:
+            return text_lower
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower)}
+
     @classmethod
     def _has_news_structure(cls, text):
         """Check if text has news-like structure."""
-        # Look for news patterns
-        news_patterns = [
-            r'اعلام\s+(شد|کرد)',      # announced
-            r'گزارش\s+می‌دهد',       # reports
-            r'بیان\s+داشت',          # stated
-            r'تأیید\s+کرد',          # confirmed
-            r'منابع\s+خبری',         # news sources
-            r'خبرگزاری',             # news agency
-            r'آژانس',                # agency
-            r'قیمت\s+.+\s+رسید',     # price reached
-            r'نرخ\s+.+\s+شد',        # rate became
-            r'بازار\s+.+\s+(بسته|باز)', # market closed/opened
-            r'\d+\s+(تومان|دلار|یورو)', # numbers with currency
-        ]
-        
-        return any(re.search(pattern, text) for pattern in news_patterns)
+        return any(pattern.search(text) for pattern in cls.NEWS_STRUCTURE_PATTERNS)
 
     @classmethod
     def _calculate_financial_entity_bonus(cls, text_lower):
@@ -238,7 +281,7 @@ class NewsFilter:
                 category_counts[category] = category_counts.get(category, 0) + 1
         
         # Determine based on topic analysis and text content
-        text_lower = text.lower() if text else ""
+        text_lower = normalize_text(text) if text else ""
         
         if any('طلا' in topic or 'سکه' in topic or 'gold' in topic for topic in matching_topics):
             return "GOLD_PRECIOUS"
@@ -255,4 +298,25 @@ class NewsFilter:
         elif any('ایران' in topic or 'iran' in topic for topic in matching_topics):
             return "IRANIAN_ECONOMY"
         else:
-            return "GENERAL_FINANCIAL"
\ No newline at end of file
+            return "GENERAL_FINANCIAL"
+
+
+def _build_keyword_automaton(*keyword_lists):
+    """Build an Aho-Corasick automaton over the given keyword lists."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keywords in keyword_lists:
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton(
+    NewsFilter.CRITICAL_FINANCIAL_KEYWORDS,
+    NewsFilter.HIGH_PRIORITY_KEYWORDS,
+    NewsFilter.GEOPOLITICAL_KEYWORDS,
+    NewsFilter.TECHNICAL_KEYWORDS,
+)
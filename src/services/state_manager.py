@@ -13,19 +13,40 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class FileBackend:
+    """Default state storage: UTF-8 text files on disk."""
+
+    @staticmethod
+    def read_text(path):
+        """Read a state file; raises FileNotFoundError if it is missing."""
+        return path.read_text(encoding='utf-8')
+
+    @staticmethod
+    def write_text(path, content):
+        """Write a state file."""
+        path.write_text(content, encoding='utf-8')
+
+
 class StateManager:
     """Manages application state persistence."""
 
-    def __init__(self):
-        """Initialize state manager."""
+    def __init__(self, backend=None):
+        """
+        Initialize state manager.
+        
+        Args:
+            backend: Object with read_text(path) and write_text(path, content)
+                (default: FileBackend)
+        """
         self.state_file = Path(STATE_FILE_PATH)
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._backend = backend or FileBackend()
 
     def save_state(self, state_data):
         """Save state data to file."""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
+            content = json.dumps(state_data, ensure_ascii=False, indent=2)
+            self._backend.write_text(self.state_file, content)
             logger.debug("State saved successfully")
         except Exception as e:
             logger.error(f"Error saving state: {e}")
@@ -33,9 +54,8 @@ class StateManager:
     def load_state(self):
         """Load state data from file."""
         try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return json.loads(self._backend.read_text(self.state_file))
+        except FileNotFoundError:
             return {}
         except Exception as e:
             logger.error(f"Error loading state: {e}")
@@ -49,15 +49,16 @@ class StateManager:
                 except OSError as e:
                     logger.warning(f"Could not create backup: {e}")
             
-            # Save new state
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(enhanced_state, f, ensure_ascii=False, indent=2)
+            # Save new state; encoded once, so the size log is the real byte count
+            content = json.dumps(enhanced_state, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(self.state_file, 'wb') as f:
+                f.write(content)
             
             # Update cache
             self._state_cache = state_data
             self._cache_timestamp = time.time()
             
-            logger.debug(f"💾 State saved successfully ({len(json.dumps(state_data))} bytes)")
+            logger.debug(f"💾 State saved successfully ({len(content)} bytes)")
             
         except Exception as e:
             logger.error(f"Error saving state: {e}")
@@ -80,8 +81,9 @@ class StateManager:
             
             # Load from file
             if self.state_file.exists():
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    content = f.read()
+                loaded_data = json.loads(content)
                 
                 # Handle both old format (direct data) and new format (with metadata)
                 if isinstance(loaded_data, dict) and 'data' in loaded_data:
@@ -97,7 +99,7 @@ class StateManager:
                 self._state_cache = state_data
                 self._cache_timestamp = time.time()
                 
-                logger.debug(f"📂 State loaded successfully ({len(json.dumps(state_data))} bytes)")
+                logger.debug(f"📂 State loaded successfully ({len(content)} bytes)")
                 return state_data
             
             # Try backup if main file doesn't exist
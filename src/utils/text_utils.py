@@ -0,0 +1,36 @@
+"""
+Text normalization helpers for keyword matching.
+Folds Arabic letter variants to their Persian forms so keyword lists match either spelling.
+"""
+
+# Arabic yeh/kaf/alef maksura fold to Persian yeh/kaf; invisible marks that
+# break substring matches are dropped. ZWNJ (U+200C) is kept because it is
+# part of Persian spelling and of several keywords.
+_NORMALIZE_TABLE = str.maketrans({
+    "\u064a": "\u06cc",  # Arabic yeh -> Persian yeh
+    "\u0649": "\u06cc",  # alef maksura -> Persian yeh
+    "\u0643": "\u06a9",  # Arabic kaf -> Persian kaf
+    "\u200b": None,      # zero-width space
+    "\u200d": None,      # zero-width joiner
+    "\u200e": None,      # left-to-right mark
+    "\u200f": None,      # right-to-left mark
+    "\ufeff": None,      # byte order mark
+})
+
+
+def normalize_text(text):
+    """
+    Lower-case text and fold it for keyword matching.
+
+    Args:
+        text: Raw message text
+
+    Returns:
+        str: Normalized text
+    """
+    return text.lower().translate(_NORMALIZE_TABLE)
+
+
+__all__ = [
+    'normalize_text'
+]
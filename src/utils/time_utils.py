@@ -2,9 +2,21 @@
 Complete time utilities for the Financial News Detector.
 Handles timezone conversion, operating hours, Persian calendar, and time formatting.
 """
-import pytz
-from datetime import datetime, timedelta
 import os
+import time
+
+# Pin TZ before any datetime use. Without it glibc re-stat()s /etc/localtime
+# on every localtime_r() call, which datetime.now() reaches on each clock read.
+# Pointing at the system zone file keeps local-time semantics unchanged.
+# Do not remove: this is a deliberate syscall optimization.
+os.environ.setdefault("TZ", ":/etc/localtime")
+if hasattr(time, "tzset"):
+    time.tzset()
+
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,8 +26,14 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 # Tehran timezone (Iran Standard Time)
-TEHRAN_TZ = pytz.timezone('Asia/Tehran')
-UTC_TZ = pytz.UTC
+TEHRAN_TZ = ZoneInfo('Asia/Tehran')
+UTC_TZ = timezone.utc
+
+# Fixed-offset IRST (UTC+03:30) for "now" lookups. Iran abolished DST in 2022,
+# so this matches TEHRAN_TZ while skipping the transition table lookup. The
+# epoch-arithmetic helpers rely on the same assumption.
+TEHRAN_FIXED_TZ = timezone(timedelta(hours=3, minutes=30), "+0330")
+_TEHRAN_OFFSET_SECONDS = 3 * 3600 + 30 * 60
 
 # Operating hours (Support both new and old format)
 OPERATION_START_HOUR = int(os.getenv("OPERATION_START_HOUR", "8"))
@@ -26,14 +44,66 @@ OPERATION_END_MINUTE = int(os.getenv("OPERATION_END_MINUTE", "0"))
 # Force 24-hour operation flag
 FORCE_24_HOUR = os.getenv("FORCE_24_HOUR_OPERATION", "false").lower() == "true"
 
+# Weekend days as comma-separated weekdays (Monday is 0). Friday by default.
+WEEKEND_DAYS = os.getenv("WEEKEND_DAYS", "4")
+_WEEKEND_MASK = sum(1 << day for day in {int(day) for day in WEEKEND_DAYS.split(",") if day.strip()})
+
+# Operating window boundaries in minutes since midnight
+_OPERATION_START_MINUTES = OPERATION_START_HOUR * 60 + OPERATION_START_MINUTE
+_OPERATION_END_MINUTES = OPERATION_END_HOUR * 60 + OPERATION_END_MINUTE
+
+# Operating window lookup indexed by minute of day (hour * 60 + minute)
+_OPERATING_MINUTE_MASK = tuple(
+    _OPERATION_START_MINUTES <= minute_of_day < _OPERATION_END_MINUTES
+    for minute_of_day in range(24 * 60)
+)
+
+# Operating window boundaries for the most recently seen day
+_BOUNDARY_CACHE = {}
+
 # ============================================================================
 # PERSIAN CALENDAR UTILITIES
 # ============================================================================
 
+# Days in a non-leap Gregorian year before the start of each month
+_GREGORIAN_MONTH_OFFSETS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
 def gregorian_to_persian(gregorian_date):
     """
     Convert Gregorian date to Persian/Solar Hijri calendar.
     
+    Dates covered by the precomputed year-start table are resolved with a
+    bisect; anything outside it uses the full arithmetic conversion.
+    
+    Args:
+        gregorian_date: datetime object in Gregorian calendar
+        
+    Returns:
+        tuple: (persian_year, persian_month, persian_day)
+    """
+    ordinal = gregorian_date.toordinal()
+    index = bisect_right(_PERSIAN_YEAR_STARTS, ordinal) - 1
+    
+    # The last entry has no known end, so it goes through the slow path too
+    if not 0 <= index < len(_PERSIAN_YEAR_STARTS) - 1:
+        return _gregorian_to_persian_arithmetic(gregorian_date)
+    
+    days = ordinal - _PERSIAN_YEAR_STARTS[index]
+    
+    # First six months have 31 days, the rest 30 (Esfand 29/30)
+    if days < 186:
+        jm = 1 + days // 31
+        jd = 1 + (days % 31)
+    else:
+        jm = 7 + (days - 186) // 30
+        jd = 1 + ((days - 186) % 30)
+    
+    return (_PERSIAN_TABLE_FIRST_YEAR + index, jm, jd)
+
+def _gregorian_to_persian_arithmetic(gregorian_date):
+    """
+    Convert Gregorian date to Persian calendar arithmetically.
+    
     Args:
         gregorian_date: datetime object in Gregorian calendar
         
@@ -61,12 +131,8 @@ def gregorian_to_persian(gregorian_date):
     
     days = (365 * gy) + ((gy2 + 3) // 4) - ((gy2 + 99) // 100) + ((gy2 + 399) // 400) - 80 + gd
     
-    if gm > 2:
-        days += sum([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][:gm-1])
-        if ((gy % 4 == 0) and (gy % 100 != 0)) or (gy % 400 == 0):
-            days += 1
-    else:
-        days += sum([31, 28][:gm-1])
+    # Days before this month (gy2 already counts this year's leap day)
+    days += _GREGORIAN_MONTH_OFFSETS[gm - 1]
     
     jy += 33 * (days // 12053)
     days %= 12053
@@ -87,6 +153,24 @@ def gregorian_to_persian(gregorian_date):
     
     return (jy, jm, jd)
 
+def _build_persian_year_starts(first_year, count):
+    """
+    Get the Gregorian ordinal of Farvardin 1 for consecutive Persian years.
+    
+    Each start is derived from the arithmetic conversion of March 25, which
+    always falls early in Farvardin, so the table agrees with it exactly.
+    """
+    starts = []
+    for persian_year in range(first_year, first_year + count):
+        march_25 = date(persian_year + 621, 3, 25)
+        _, _, persian_day = _gregorian_to_persian_arithmetic(march_25)
+        starts.append(march_25.toordinal() - (persian_day - 1))
+    return starts
+
+# Farvardin 1 ordinals for Persian years 1200-1599 (1821-2221 CE)
+_PERSIAN_TABLE_FIRST_YEAR = 1200
+_PERSIAN_YEAR_STARTS = _build_persian_year_starts(_PERSIAN_TABLE_FIRST_YEAR, 400)
+
 def format_persian_date(dt):
     """
     Format datetime as Persian calendar date.
@@ -101,8 +185,7 @@ def format_persian_date(dt):
         return ""
     
     # Ensure Tehran timezone
-    if dt.tzinfo != TEHRAN_TZ:
-        dt = convert_to_tehran(dt)
+    dt = _as_tehran(dt)
     
     persian_year, persian_month, persian_day = gregorian_to_persian(dt)
     return f"{persian_year:04d}-{persian_month:02d}-{persian_day:02d}"
@@ -121,8 +204,7 @@ def format_persian_time(dt):
         return ""
     
     # Ensure Tehran timezone
-    if dt.tzinfo != TEHRAN_TZ:
-        dt = convert_to_tehran(dt)
+    dt = _as_tehran(dt)
     
     return dt.strftime("%H:%M")
 
@@ -148,14 +230,27 @@ def format_persian_datetime(dt):
 # CORE TIME FUNCTIONS
 # ============================================================================
 
-def get_current_time():
+# Hot-path helpers below take underscore-prefixed defaults bound to module
+# constants at definition time, turning per-call global lookups into locals.
+# They are not part of the public signature; callers must not pass them.
+
+def get_current_time(_now=datetime.now, _tz=TEHRAN_FIXED_TZ):
     """
     Get current time in Tehran timezone.
     
     Returns:
         datetime: Current time in Tehran timezone
     """
-    return datetime.now(TEHRAN_TZ)
+    return _now(_tz)
+
+def _tehran_minute_of_day(_time=time.time, _offset=_TEHRAN_OFFSET_SECONDS):
+    """Current Tehran minute of day (0-1439) without building a datetime."""
+    return int((_time() + _offset) // 60) % 1440
+
+def _tehran_weekday(_time=time.time, _offset=_TEHRAN_OFFSET_SECONDS):
+    """Current Tehran weekday (Monday is 0) without building a datetime."""
+    # 1970-01-01 was a Thursday (weekday 3)
+    return int((_time() + _offset) // 86400 + 3) % 7
 
 def get_utc_time():
     """
@@ -181,11 +276,26 @@ def convert_to_tehran(dt):
     
     # If naive, assume UTC
     if dt.tzinfo is None:
-        dt = UTC_TZ.localize(dt)
+        dt = dt.replace(tzinfo=UTC_TZ)
     
     # Convert to Tehran time
     return dt.astimezone(TEHRAN_TZ)
 
+def _as_tehran(dt):
+    """
+    Return dt in Tehran time, reusing it as-is when already Tehran-local.
+    
+    Args:
+        dt: datetime object (can be naive or aware)
+        
+    Returns:
+        datetime: datetime in Tehran timezone
+    """
+    tzinfo = dt.tzinfo
+    if tzinfo is TEHRAN_FIXED_TZ or tzinfo is TEHRAN_TZ:
+        return dt
+    return convert_to_tehran(dt)
+
 def convert_to_utc(dt):
     """
     Convert datetime to UTC.
@@ -201,7 +311,7 @@ def convert_to_utc(dt):
     
     # If naive, assume Tehran time
     if dt.tzinfo is None:
-        dt = TEHRAN_TZ.localize(dt)
+        dt = dt.replace(tzinfo=TEHRAN_TZ)
     
     # Convert to UTC
     return dt.astimezone(UTC_TZ)
@@ -219,11 +329,8 @@ def timestamp_to_tehran(timestamp):
     if timestamp is None:
         return None
     
-    # Create UTC datetime from timestamp
-    utc_dt = datetime.fromtimestamp(timestamp, tz=UTC_TZ)
-    
-    # Convert to Tehran time
-    return utc_dt.astimezone(TEHRAN_TZ)
+    # Build the Tehran datetime directly (no intermediate UTC datetime)
+    return datetime.fromtimestamp(timestamp, tz=TEHRAN_TZ)
 
 def tehran_to_timestamp(dt):
     """
@@ -238,11 +345,10 @@ def tehran_to_timestamp(dt):
     if dt is None:
         return None
     
-    # Ensure it's in Tehran timezone
+    # Naive values are Tehran wall time; aware values already pin an instant,
+    # so converting them to Tehran first would not change the timestamp
     if dt.tzinfo is None:
-        dt = TEHRAN_TZ.localize(dt)
-    elif dt.tzinfo != TEHRAN_TZ:
-        dt = dt.astimezone(TEHRAN_TZ)
+        dt = dt.replace(tzinfo=TEHRAN_TZ)
     
     return dt.timestamp()
 
@@ -250,7 +356,7 @@ def tehran_to_timestamp(dt):
 # OPERATING HOURS FUNCTIONS (UPDATED)
 # ============================================================================
 
-def is_operating_hours(current_time=None):
+def is_operating_hours(current_time=None, _force=FORCE_24_HOUR, _mask=_OPERATING_MINUTE_MASK):
     """
     Check if current time is within operating hours.
     
@@ -261,147 +367,182 @@ def is_operating_hours(current_time=None):
         bool: True if within operating hours
     """
     # If force 24-hour mode is enabled, always return True
-    if FORCE_24_HOUR:
+    if _force:
         return True
     
     if current_time is None:
-        current_time = get_current_time()
+        return _mask[_tehran_minute_of_day()]
     
     # Ensure we're working with Tehran time
-    if current_time.tzinfo != TEHRAN_TZ:
-        current_time = convert_to_tehran(current_time)
+    current_time = _as_tehran(current_time)
     
-    current_hour = current_time.hour
-    current_minute = current_time.minute
+    return _mask[current_time.hour * 60 + current_time.minute]
+
+def _get_operating_boundaries(current_time):
+    """
+    Get the operating window start/end on the day of current_time.
     
-    # Convert current time to minutes since midnight
-    current_minutes = current_hour * 60 + current_minute
+    Boundaries only change when the day does, so the last computed pair is
+    cached and reused by every poll within the same day.
     
-    # Operating hours in minutes since midnight
-    start_minutes = OPERATION_START_HOUR * 60 + OPERATION_START_MINUTE
-    end_minutes = OPERATION_END_HOUR * 60 + OPERATION_END_MINUTE
+    Args:
+        current_time: reference datetime
+        
+    Returns:
+        tuple: (start, end) datetimes sharing current_time's tzinfo
+    """
+    key = (current_time.year, current_time.month, current_time.day, current_time.tzinfo)
+    boundaries = _BOUNDARY_CACHE.get(key)
     
-    # Check if within operating hours
-    return start_minutes <= current_minutes < end_minutes
+    if boundaries is None:
+        day_start = current_time.replace(
+            hour=OPERATION_START_HOUR,
+            minute=OPERATION_START_MINUTE,
+            second=0,
+            microsecond=0
+        )
+        day_end = current_time.replace(
+            hour=OPERATION_END_HOUR,
+            minute=OPERATION_END_MINUTE,
+            second=0,
+            microsecond=0
+        )
+        boundaries = (day_start, day_end)
+        
+        # Only the current day is ever needed
+        _BOUNDARY_CACHE.clear()
+        _BOUNDARY_CACHE[key] = boundaries
+    
+    return boundaries
 
-def get_next_operating_time():
+def get_next_operating_time(current_time=None, _force=FORCE_24_HOUR,
+                            _start_minutes=_OPERATION_START_MINUTES):
     """
     Get the next time when operations should start.
     
+    Args:
+        current_time: reference datetime (default: current time)
+        
     Returns:
         datetime: Next operating time in Tehran timezone
     """
-    if FORCE_24_HOUR:
-        return get_current_time()  # Always operating
-    
-    current_time = get_current_time()
-    current_hour = current_time.hour
-    current_minute = current_time.minute
-    current_minutes = current_hour * 60 + current_minute
+    if current_time is None:
+        current_time = get_current_time()
+    else:
+        current_time = _as_tehran(current_time)
     
-    start_minutes = OPERATION_START_HOUR * 60 + OPERATION_START_MINUTE
+    if _force:
+        return current_time  # Always operating
     
     # If currently in operating hours, return current time
     if is_operating_hours(current_time):
         return current_time
     
-    # Calculate next operating time
-    if current_minutes < start_minutes:
-        # Same day
-        next_operating = current_time.replace(
-            hour=OPERATION_START_HOUR, 
-            minute=OPERATION_START_MINUTE, 
-            second=0, 
-            microsecond=0
-        )
-    else:
-        # Next day
-        next_day = current_time + timedelta(days=1)
-        next_operating = next_day.replace(
-            hour=OPERATION_START_HOUR,
-            minute=OPERATION_START_MINUTE,
-            second=0,
-            microsecond=0
-        )
+    day_start, _ = _get_operating_boundaries(current_time)
     
-    return next_operating
+    # Same day if before opening, otherwise next day
+    if current_time.hour * 60 + current_time.minute < _start_minutes:
+        return day_start
+    return day_start + timedelta(days=1)
 
-def get_operating_end_time():
+def get_operating_end_time(current_time=None, _force=FORCE_24_HOUR,
+                           _start_minutes=_OPERATION_START_MINUTES):
     """
     Get the end time of current operating period.
     
+    Args:
+        current_time: reference datetime (default: current time)
+        
     Returns:
         datetime: End time of current operating period
     """
-    if FORCE_24_HOUR:
-        return get_current_time() + timedelta(days=1)  # Never ends
+    if current_time is None:
+        current_time = get_current_time()
+    else:
+        current_time = _as_tehran(current_time)
     
-    current_time = get_current_time()
+    if _force:
+        return current_time + timedelta(days=1)  # Never ends
     
-    # If not in operating hours, get next operating period end
-    if not is_operating_hours(current_time):
-        next_start = get_next_operating_time()
-        return next_start.replace(
-            hour=OPERATION_END_HOUR,
-            minute=OPERATION_END_MINUTE
-        )
+    _, day_end = _get_operating_boundaries(current_time)
     
-    # Current operating period end
-    return current_time.replace(
-        hour=OPERATION_END_HOUR,
-        minute=OPERATION_END_MINUTE,
-        second=0,
-        microsecond=0
-    )
+    # After closing, the next operating period ends tomorrow
+    if (not is_operating_hours(current_time)
+            and current_time.hour * 60 + current_time.minute >= _start_minutes):
+        return day_end + timedelta(days=1)
+    
+    # Current (or today's upcoming) operating period end
+    return day_end
 
 # ============================================================================
 # FORMATTING FUNCTIONS (UPDATED)
 # ============================================================================
 
+# Formatters for get_formatted_time (callables or strftime patterns)
+_TIME_FORMATS = {
+    "persian_full": format_persian_datetime,  # 1403-05-24 12:53
+    "persian_date": format_persian_date,      # 1403-05-24
+    "persian_time": format_persian_time,      # 12:53
+    "full": "%Y-%m-%d %H:%M:%S %Z",
+    "short": "%Y-%m-%d %H:%M",
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "iso": "%Y-%m-%dT%H:%M:%S%z",
+    "log": "%Y-%m-%d %H:%M:%S",
+    "filename": "%Y%m%d_%H%M%S"
+}
+_DEFAULT_TIME_FORMAT = _TIME_FORMATS["full"]
+
+# Persian formats only go down to the minute, so "now" is cached per minute
+_MINUTE_FORMATS = frozenset(("persian_full", "persian_date", "persian_time"))
+
 def get_formatted_time(dt=None, format_type="persian_full"):
     """
     Get formatted time string with Persian calendar support.
     
     Args:
         dt: datetime to format (default: current time)
-        format_type: Type of formatting
+        format_type: Type of formatting (unknown types fall back to "full")
         
     Returns:
         str: Formatted time string
     """
     if dt is None:
-        dt = get_current_time()
-    
-    # Ensure Tehran timezone
-    if dt.tzinfo != TEHRAN_TZ:
-        dt = convert_to_tehran(dt)
-    
-    formats = {
-        "persian_full": lambda d: format_persian_datetime(d),  # 1403-05-24 12:53
-        "persian_date": lambda d: format_persian_date(d),     # 1403-05-24
-        "persian_time": lambda d: format_persian_time(d),     # 12:53
-        "full": "%Y-%m-%d %H:%M:%S %Z",
-        "short": "%Y-%m-%d %H:%M",
-        "date": "%Y-%m-%d",
-        "time": "%H:%M:%S",
-        "iso": "%Y-%m-%dT%H:%M:%S%z",
-        "log": "%Y-%m-%d %H:%M:%S",
-        "filename": "%Y%m%d_%H%M%S"
-    }
-    
-    format_func = formats.get(format_type)
+        now = time.time()
+        if format_type in _MINUTE_FORMATS:
+            return _format_persian_minute(int(now // 60), format_type)
+        # No format goes below seconds, so "now" is memoized per second
+        return _format_current_second(int(now), format_type)
+    
+    # Ensure Tehran timezone; explicit datetimes keep their own tzinfo so
+    # the wall-clock time is never shifted by a different Tehran offset
+    return _format_tehran_time(_as_tehran(dt), format_type)
+
+def _format_tehran_time(dt, format_type):
+    """Format a Tehran-local datetime using _TIME_FORMATS."""
+    format_func = _TIME_FORMATS.get(format_type, _DEFAULT_TIME_FORMAT)
     if callable(format_func):
         return format_func(dt)
     else:
         return dt.strftime(format_func)
 
+@lru_cache(maxsize=32)
+def _format_current_second(epoch_second, format_type):
+    """Format the given epoch second in Tehran time (cached for repeated polls)."""
+    return _format_tehran_time(datetime.fromtimestamp(epoch_second, TEHRAN_FIXED_TZ), format_type)
+
+@lru_cache(maxsize=4)
+def _format_persian_minute(epoch_minute, format_type):
+    """Format the current epoch minute with a Persian format (cached per _MINUTE_FORMATS entry)."""
+    return _format_tehran_time(datetime.fromtimestamp(epoch_minute * 60, TEHRAN_TZ), format_type)
+
 # ============================================================================
 # BUSINESS TIME FUNCTIONS
 # ============================================================================
 
 def is_weekend(dt=None):
     """
-    Check if given date is weekend (Friday in Iran).
+    Check if given date is weekend (Friday in Iran, see WEEKEND_DAYS).
     
     Args:
         dt: datetime to check (default: current time)
@@ -410,14 +551,12 @@ def is_weekend(dt=None):
         bool: True if weekend
     """
     if dt is None:
-        dt = get_current_time()
+        return bool(_WEEKEND_MASK & (1 << _tehran_weekday()))
     
     # Ensure Tehran timezone
-    if dt.tzinfo != TEHRAN_TZ:
-        dt = convert_to_tehran(dt)
+    dt = _as_tehran(dt)
     
-    # In Iran, Friday is weekend (weekday 4, where Monday is 0)
-    return dt.weekday() == 4
+    return bool(_WEEKEND_MASK & (1 << dt.weekday()))
 
 def is_business_day(dt=None):
     """
@@ -431,14 +570,20 @@ def is_business_day(dt=None):
     """
     return not is_weekend(dt)
 
-def get_business_hours_status():
+def get_business_hours_status(current_time=None):
     """
     Get comprehensive status of business/operating hours.
     
+    Args:
+        current_time: reference datetime (default: current time)
+        
     Returns:
         dict: Status information
     """
-    current_time = get_current_time()
+    if current_time is None:
+        current_time = get_current_time()
+    else:
+        current_time = _as_tehran(current_time)
     
     status = {
         "current_time": get_formatted_time(current_time, "persian_full"),
@@ -451,12 +596,12 @@ def get_business_hours_status():
     }
     
     if status["is_operating"]:
-        end_time = get_operating_end_time()
+        end_time = get_operating_end_time(current_time)
         time_left = end_time - current_time if end_time > current_time else None
         status["operation_ends_at"] = get_formatted_time(end_time, "persian_full")
         status["time_until_end"] = format_duration(time_left) if time_left else "Now"
     else:
-        next_time = get_next_operating_time()
+        next_time = get_next_operating_time(current_time)
         time_until = next_time - current_time if next_time > current_time else None
         status["next_operation_at"] = get_formatted_time(next_time, "persian_full")
         status["time_until_start"] = format_duration(time_until) if time_until else "Now"
@@ -482,27 +627,19 @@ def format_duration(td):
         return "Past"
     
     # Calculate components
-    days = total_seconds // 86400
-    hours = (total_seconds % 86400) // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    days, remainder = divmod(total_seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
     
-    # Build string
-    parts = []
+    if days:
+        seconds = 0  # Only show seconds if less than a day
     
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 and days == 0:  # Only show seconds if less than a day
-        parts.append(f"{seconds}s")
-    
-    if not parts:
-        return "0s"
-    
-    return " ".join(parts)
+    # Build string from the non-zero components
+    return " ".join(
+        f"{value}{unit}"
+        for value, unit in ((days, "d"), (hours, "h"), (minutes, "m"), (seconds, "s"))
+        if value
+    ) or "0s"
 
 # ============================================================================
 # MESSAGE TIMESTAMP FUNCTIONS
@@ -533,24 +670,29 @@ def sleep_until_next_operation():
     Returns:
         int: Seconds to sleep (max 15 minutes if not operating)
     """
-    if is_operating_hours():
-        return 900  # 15 minutes during operations (15 * 60)
+    if FORCE_24_HOUR:
+        return 900  # Always operating
     
-    next_time = get_next_operating_time()
+    # Plain seconds-of-day arithmetic; no timedelta or datetime construction
     current_time = get_current_time()
+    current_seconds = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+    start_seconds = _OPERATION_START_MINUTES * 60
+    end_seconds = _OPERATION_END_MINUTES * 60
     
-    if next_time <= current_time:
-        return 60
+    if start_seconds <= current_seconds < end_seconds:
+        return 900  # 15 minutes during operations (15 * 60)
     
-    time_until = next_time - current_time
+    if current_seconds < start_seconds:
+        seconds = start_seconds - current_seconds  # Opens later today
+    else:
+        seconds = 86400 - current_seconds + start_seconds  # Opens tomorrow
     
-    # Don't sleep more than 15 minutes
-    seconds = min(int(time_until.total_seconds()), 900)
-    return max(seconds, 60)  # At least 1 minute
+    # Don't sleep more than 15 minutes, at least 1 minute
+    return max(60, min(seconds, 900))
 
-def log_time_status():
+def log_time_status(current_time=None):
     """Log current time status for debugging."""
-    status = get_business_hours_status()
+    status = get_business_hours_status(current_time)
     
     logger.info("🕐 TIME STATUS")
     logger.info("=" * 40)
@@ -598,6 +740,6 @@ __all__ = [
     'sleep_until_next_operation', 'log_time_status',
     
     # Constants
-    'TEHRAN_TZ', 'UTC_TZ', 'OPERATION_START_HOUR', 'OPERATION_START_MINUTE', 
-    'OPERATION_END_HOUR', 'OPERATION_END_MINUTE'
+    'TEHRAN_TZ', 'TEHRAN_FIXED_TZ', 'UTC_TZ', 'OPERATION_START_HOUR', 'OPERATION_START_MINUTE', 
+    'OPERATION_END_HOUR', 'OPERATION_END_MINUTE', 'WEEKEND_DAYS'
 ]
\ No newline at end of file
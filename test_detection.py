@@ -3,8 +3,14 @@
 Complete test script for new features: Persian calendar, new schedule, and media handling.
 Tests all the new functionality to ensure everything works correctly.
 """
+import argparse
 import asyncio
+import functools
+import importlib
+import json
+import logging
 import sys
+import traceback
 import os
 from pathlib import Path
 from datetime import datetime
@@ -13,411 +19,496 @@ from datetime import datetime
 project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
-print("🧪 FINANCIAL NEWS DETECTOR - NEW FEATURES TEST")
-print("=" * 80)
+# Project imports are resolved once here rather than inside every suite.
+# A failure is recorded in a sentinel so the affected suites fail fast.
+try:
+    from src.utils.time_utils import (
+        get_current_time, get_formatted_time, format_persian_date,
+        format_persian_time, gregorian_to_persian, add_timestamp_to_message,
+        is_operating_hours, get_business_hours_status, get_next_operating_time
+    )
+    from src.utils import time_utils
+    from src.services.news_detector import NewsDetector
+    SRC_IMPORT_ERROR = None
+except ImportError as e:
+    SRC_IMPORT_ERROR = e
 
+try:
+    import aiofiles
+    import aiohttp
+    MEDIA_IMPORT_ERROR = None
+except ImportError as e:
+    aiofiles = None
+    MEDIA_IMPORT_ERROR = e
+
+try:
+    from config import credentials, settings
+    CONFIG_IMPORT_ERROR = None
+except Exception as e:
+    CONFIG_IMPORT_ERROR = e
+
+# Modules checked by test_imports, preloaded once here so the suite only
+# inspects sys.modules instead of re-entering the import machinery
+IMPORT_TESTS = [
+    ("Time Utils", "src.utils.time_utils"),
+    ("News Detector", "src.services.news_detector"),
+    ("News Filter", "src.services.news_filter"),
+    ("News Handler", "src.handlers.news_handler"),
+    ("Bot API Client", "src.client.bot_api"),
+    ("Telegram Client", "src.client.telegram_client"),
+    ("Logger", "src.utils.logger"),
+    ("Credentials", "config.credentials"),
+    ("Settings", "config.settings"),
+]
+IMPORT_ERRORS = {}
+for _name, _module_path in IMPORT_TESTS:
+    try:
+        importlib.import_module(_module_path)
+    except Exception as e:
+        IMPORT_ERRORS[_module_path] = e
+
+log = logging.getLogger(__name__)
+
+# Pass/fail per suite is saved here; --json-only skips the console report
+RESULTS_FILE = project_root / "test_results.json"
+
+# Financial news samples for test_detection_with_new_format
+TEST_CASES = [
+    {
+        'text': 'قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید',
+        'should_detect': True,
+        'category': 'Gold'
+    },
+    {
+        'text': 'نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید',
+        'should_detect': True,
+        'category': 'Currency'
+    },
+    {
+        'text': 'بانک مرکزی ایران نرخ سود بانکی را اعلام کرد',
+        'should_detect': True,
+        'category': 'Iranian Economy'
+    },
+    {
+        'text': 'تیم فوتبال پرسپولیس امروز بازی دارد',
+        'should_detect': False,
+        'category': 'Sports (Non-Financial)'
+    }
+]
+
+def suite(name):
+    """
+    Decorate a test suite so an exception counts as a failed suite.
+    
+    The error and its traceback are logged once here instead of in every
+    suite, and one broken suite can't cancel the others in run_all_tests.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                log.exception("❌ %s Test FAILED: %s", name, e)
+                return False
+        return wrapper
+    return decorator
+
+@suite("Persian Calendar")
 async def test_persian_calendar():
     """Test Persian calendar conversion and formatting."""
-    print("🗓️ TESTING PERSIAN CALENDAR")
-    print("=" * 50)
+    log.info("🗓️ TESTING PERSIAN CALENDAR")
+    log.info("=" * 50)
     
-    try:
-        from src.utils.time_utils import (
-            get_current_time, get_formatted_time, format_persian_date,
-            format_persian_time, format_persian_datetime, gregorian_to_persian
-        )
-        
-        # Test current time
-        current_time = get_current_time()
-        print(f"✅ Current Tehran Time: {current_time}")
-        
-        # Test Persian calendar formatting
-        persian_full = get_formatted_time(current_time, "persian_full")
-        persian_date = format_persian_date(current_time)
-        persian_time = format_persian_time(current_time)
-        
-        print(f"✅ Persian Full Format: {persian_full}")
-        print(f"✅ Persian Date: {persian_date}")
-        print(f"✅ Persian Time: {persian_time}")
-        
-        # Test conversion algorithm
-        persian_year, persian_month, persian_day = gregorian_to_persian(current_time)
-        print(f"✅ Conversion Result: {persian_year}/{persian_month:02d}/{persian_day:02d}")
-        
-        # Test message format
-        from src.utils.time_utils import add_timestamp_to_message
-        test_message = "📈 تست خبر مالی"
-        formatted_message = add_timestamp_to_message(test_message)
-        print(f"\n✅ Formatted Message:")
-        print("-" * 30)
-        print(formatted_message)
-        print("-" * 30)
-        
-        print("🗓️ Persian Calendar Test: ✅ PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Persian Calendar Test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if SRC_IMPORT_ERROR:
+        raise SRC_IMPORT_ERROR
+    
+    # Test current time
+    current_time = get_current_time()
+    log.info(f"✅ Current Tehran Time: {current_time}")
+    
+    # Test Persian calendar formatting
+    persian_full = get_formatted_time(current_time, "persian_full")
+    persian_date = format_persian_date(current_time)
+    persian_time = format_persian_time(current_time)
+    
+    log.info(f"✅ Persian Full Format: {persian_full}")
+    log.info(f"✅ Persian Date: {persian_date}")
+    log.info(f"✅ Persian Time: {persian_time}")
+    
+    # Test conversion algorithm
+    persian_year, persian_month, persian_day = gregorian_to_persian(current_time)
+    log.info(f"✅ Conversion Result: {persian_year}/{persian_month:02d}/{persian_day:02d}")
+    
+    # Test message format
+    test_message = "📈 تست خبر مالی"
+    formatted_message = add_timestamp_to_message(test_message)
+    log.info(f"\n✅ Formatted Message:")
+    log.info("-" * 30)
+    log.info(formatted_message)
+    log.info("-" * 30)
+    
+    log.info("🗓️ Persian Calendar Test: ✅ PASSED")
+    return True
 
+@suite("Operating Hours")
 async def test_operating_hours():
     """Test new operating hours (8:30 AM - 10:00 PM)."""
-    print("\n⏰ TESTING OPERATING HOURS")
-    print("=" * 50)
+    log.info("\n⏰ TESTING OPERATING HOURS")
+    log.info("=" * 50)
     
-    try:
-        from src.utils.time_utils import (
-            is_operating_hours, get_business_hours_status,
-            get_next_operating_time, OPERATION_START_HOUR, OPERATION_START_MINUTE,
-            OPERATION_END_HOUR, OPERATION_END_MINUTE
-        )
-        
-        print(f"✅ Operating Hours: {OPERATION_START_HOUR:02d}:{OPERATION_START_MINUTE:02d} - {OPERATION_END_HOUR:02d}:{OPERATION_END_MINUTE:02d}")
-        print(f"✅ Currently Operating: {'Yes' if is_operating_hours() else 'No'}")
-        
-        # Get detailed status
-        status = get_business_hours_status()
-        print(f"✅ Current Time (Persian): {status['current_time']}")
-        print(f"✅ Current Time (Gregorian): {status['current_time_gregorian']}")
-        print(f"✅ Is Business Day: {status['is_business_day']}")
-        print(f"✅ Operating Hours: {status['operating_hours']}")
-        
-        # Test next operation time
-        next_time = get_next_operating_time()
-        print(f"✅ Next Operation Time: {next_time}")
-        
-        print("⏰ Operating Hours Test: ✅ PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Operating Hours Test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if SRC_IMPORT_ERROR:
+        raise SRC_IMPORT_ERROR
+    
+    log.info(f"✅ Operating Hours: {time_utils.OPERATION_START_HOUR:02d}:{time_utils.OPERATION_START_MINUTE:02d} - "
+             f"{time_utils.OPERATION_END_HOUR:02d}:{time_utils.OPERATION_END_MINUTE:02d}")
+    log.info(f"✅ Currently Operating: {'Yes' if is_operating_hours() else 'No'}")
+    
+    # Get detailed status
+    status = get_business_hours_status()
+    log.info(f"✅ Current Time (Persian): {status['current_time']}")
+    log.info(f"✅ Current Time (Gregorian): {status['current_time_gregorian']}")
+    log.info(f"✅ Is Business Day: {status['is_business_day']}")
+    log.info(f"✅ Operating Hours: {status['operating_hours']}")
+    
+    # Test next operation time
+    next_time = get_next_operating_time()
+    log.info(f"✅ Next Operation Time: {next_time}")
+    
+    log.info("⏰ Operating Hours Test: ✅ PASSED")
+    return True
 
+@suite("News Format")
 async def test_news_format():
     """Test the new news format with Persian calendar."""
-    print("\n📰 TESTING NEWS FORMAT")
-    print("=" * 50)
+    log.info("\n📰 TESTING NEWS FORMAT")
+    log.info("=" * 50)
     
-    try:
-        from src.utils.time_utils import get_formatted_time
-        
-        # Sample news text
-        news_text = "📈 فرمانده نیروی هوایی ارتش اسرائیل: ما برای تمام سناریو های ممکن آماده می‌شویم؛ از جمله احتمال حمله موشکی قریب الوقوع ایران."
-        attribution = "📡 @anilnewsonline"
-        timestamp = f"🕐 {get_formatted_time(format_type='persian_full')}"
-        
-        formatted_news = f"{news_text}\n{attribution}\n{timestamp}"
-        
-        print("✅ Sample formatted news:")
-        print("-" * 30)
-        print(formatted_news)
-        print("-" * 30)
-        
-        # Test different time formats
-        print(f"✅ Persian Full: {get_formatted_time(format_type='persian_full')}")
-        print(f"✅ Persian Date: {get_formatted_time(format_type='persian_date')}")
-        print(f"✅ Persian Time: {get_formatted_time(format_type='persian_time')}")
-        
-        print("📰 News Format Test: ✅ PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"❌ News Format Test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if SRC_IMPORT_ERROR:
+        raise SRC_IMPORT_ERROR
+    
+    # Format every variant from the same instant
+    now = get_current_time()
+    persian_full = get_formatted_time(now, "persian_full")
+    
+    # Sample news text
+    news_text = "📈 فرمانده نیروی هوایی ارتش اسرائیل: ما برای تمام سناریو های ممکن آماده می‌شویم؛ از جمله احتمال حمله موشکی قریب الوقوع ایران."
+    attribution = "📡 @anilnewsonline"
+    timestamp = f"🕐 {persian_full}"
+    
+    formatted_news = f"{news_text}\n{attribution}\n{timestamp}"
+    
+    log.info("✅ Sample formatted news:")
+    log.info("-" * 30)
+    log.info(formatted_news)
+    log.info("-" * 30)
+    
+    # Test different time formats
+    log.info(f"✅ Persian Full: {persian_full}")
+    log.info(f"✅ Persian Date: {get_formatted_time(now, 'persian_date')}")
+    log.info(f"✅ Persian Time: {get_formatted_time(now, 'persian_time')}")
+    
+    log.info("📰 News Format Test: ✅ PASSED")
+    return True
 
+@suite("Media Directories")
 async def test_media_directories():
     """Test media directory creation and permissions."""
-    print("\n📁 TESTING MEDIA DIRECTORIES")
-    print("=" * 50)
+    log.info("\n📁 TESTING MEDIA DIRECTORIES")
+    log.info("=" * 50)
+    
+    if CONFIG_IMPORT_ERROR:
+        raise CONFIG_IMPORT_ERROR
     
+    MEDIA_DIR = settings.MEDIA_DIR
+    TEMP_MEDIA_DIR = settings.TEMP_MEDIA_DIR
+    ENABLE_MEDIA_PROCESSING = settings.ENABLE_MEDIA_PROCESSING
+    
+    log.info(f"✅ Media Processing Enabled: {ENABLE_MEDIA_PROCESSING}")
+    log.info(f"✅ Media Directory: {MEDIA_DIR}")
+    log.info(f"✅ Temp Media Directory: {TEMP_MEDIA_DIR}")
+    log.info(f"✅ Media Dir Exists: {'Yes' if MEDIA_DIR.exists() else 'No'}")
+    log.info(f"✅ Temp Media Dir Exists: {'Yes' if TEMP_MEDIA_DIR.exists() else 'No'}")
+    
+    # Test write permissions
+    test_file = TEMP_MEDIA_DIR / "test_write.txt"
     try:
-        from config.settings import MEDIA_DIR, TEMP_MEDIA_DIR, ENABLE_MEDIA_PROCESSING
-        
-        print(f"✅ Media Processing Enabled: {ENABLE_MEDIA_PROCESSING}")
-        print(f"✅ Media Directory: {MEDIA_DIR}")
-        print(f"✅ Temp Media Directory: {TEMP_MEDIA_DIR}")
-        print(f"✅ Media Dir Exists: {'Yes' if MEDIA_DIR.exists() else 'No'}")
-        print(f"✅ Temp Media Dir Exists: {'Yes' if TEMP_MEDIA_DIR.exists() else 'No'}")
-        
-        # Test write permissions
-        test_file = TEMP_MEDIA_DIR / "test_write.txt"
-        try:
-            test_file.write_text("test content")
-            test_file.unlink()
-            print("✅ Write Permission: Yes")
-        except Exception as e:
-            print(f"❌ Write Permission: No ({e})")
-            return False
-        
-        # Test media support imports
-        try:
-            import aiofiles
-            import aiohttp
-            print("✅ Media Support Libraries: Available")
-        except ImportError as e:
-            print(f"⚠️ Media Support Libraries: Missing ({e})")
-            print("💡 Install with: pip install aiofiles aiohttp")
-        
-        print("📁 Media Directories Test: ✅ PASSED")
-        return True
-            
-    except ImportError as e:
-        print(f"❌ Media Directories Test FAILED: {e}")
-        print("💡 Make sure config/settings.py is properly configured")
+        # Keep the disk I/O off the event loop the other suites share
+        if aiofiles:
+            async with aiofiles.open(test_file, 'w') as f:
+                await f.write("test content")
+        else:
+            await asyncio.to_thread(test_file.write_text, "test content")
+        await asyncio.to_thread(test_file.unlink)
+        log.info("✅ Write Permission: Yes")
+    except Exception as e:
+        log.error(f"❌ Write Permission: No ({e})")
         return False
+    
+    # Test media support imports
+    if MEDIA_IMPORT_ERROR is None:
+        log.info("✅ Media Support Libraries: Available")
+    else:
+        log.warning(f"⚠️ Media Support Libraries: Missing ({MEDIA_IMPORT_ERROR})")
+        log.info("💡 Install with: pip install aiofiles aiohttp")
+    
+    log.info("📁 Media Directories Test: ✅ PASSED")
+    return True
+        
 
+@suite("Schedule Settings")
 async def test_schedule_settings():
     """Test schedule settings."""
-    print("\n📅 TESTING SCHEDULE SETTINGS")
-    print("=" * 50)
+    log.info("\n📅 TESTING SCHEDULE SETTINGS")
+    log.info("=" * 50)
     
-    try:
-        from config.settings import (
-            NEWS_CHECK_INTERVAL, OPERATION_START_HOUR, OPERATION_START_MINUTE,
-            OPERATION_END_HOUR, OPERATION_END_MINUTE
-        )
-        
-        print(f"✅ News Check Interval: {NEWS_CHECK_INTERVAL} seconds")
-        print(f"✅ News Check Interval: {NEWS_CHECK_INTERVAL / 60} minutes")
-        print(f"✅ Start Time: {OPERATION_START_HOUR:02d}:{OPERATION_START_MINUTE:02d}")
-        print(f"✅ End Time: {OPERATION_END_HOUR:02d}:{OPERATION_END_MINUTE:02d}")
-        
-        # Validate schedule
-        if NEWS_CHECK_INTERVAL == 900:
-            print("✅ Schedule correctly set to 15 minutes")
-        else:
-            print(f"⚠️ Schedule is set to {NEWS_CHECK_INTERVAL / 60} minutes (expected 15)")
+    if CONFIG_IMPORT_ERROR:
+        raise CONFIG_IMPORT_ERROR
+    
+    NEWS_CHECK_INTERVAL = settings.NEWS_CHECK_INTERVAL
+    OPERATION_START_HOUR = settings.OPERATION_START_HOUR
+    OPERATION_START_MINUTE = settings.OPERATION_START_MINUTE
+    OPERATION_END_HOUR = settings.OPERATION_END_HOUR
+    OPERATION_END_MINUTE = settings.OPERATION_END_MINUTE
+    
+    log.info(f"✅ News Check Interval: {NEWS_CHECK_INTERVAL} seconds")
+    log.info(f"✅ News Check Interval: {NEWS_CHECK_INTERVAL / 60} minutes")
+    log.info(f"✅ Start Time: {OPERATION_START_HOUR:02d}:{OPERATION_START_MINUTE:02d}")
+    log.info(f"✅ End Time: {OPERATION_END_HOUR:02d}:{OPERATION_END_MINUTE:02d}")
+    
+    # Validate schedule
+    if NEWS_CHECK_INTERVAL == 900:
+        log.info("✅ Schedule correctly set to 15 minutes")
+    else:
+        log.warning(f"⚠️ Schedule is set to {NEWS_CHECK_INTERVAL / 60} minutes (expected 15)")
+    
+    if OPERATION_START_HOUR == 8 and OPERATION_START_MINUTE == 30:
+        log.info("✅ Start time correctly set to 8:30 AM")
+    else:
+        log.warning(f"⚠️ Start time is {OPERATION_START_HOUR:02d}:{OPERATION_START_MINUTE:02d} (expected 08:30)")
+    
+    if OPERATION_END_HOUR == 22 and OPERATION_END_MINUTE == 0:
+        log.info("✅ End time correctly set to 10:00 PM")
+    else:
+        log.warning(f"⚠️ End time is {OPERATION_END_HOUR:02d}:{OPERATION_END_MINUTE:02d} (expected 22:00)")
         
-        if OPERATION_START_HOUR == 8 and OPERATION_START_MINUTE == 30:
-            print("✅ Start time correctly set to 8:30 AM")
-        else:
-            print(f"⚠️ Start time is {OPERATION_START_HOUR:02d}:{OPERATION_START_MINUTE:02d} (expected 08:30)")
+    log.info("📅 Schedule Settings Test: ✅ PASSED")
+    return True
         
-        if OPERATION_END_HOUR == 22 and OPERATION_END_MINUTE == 0:
-            print("✅ End time correctly set to 10:00 PM")
-        else:
-            print(f"⚠️ End time is {OPERATION_END_HOUR:02d}:{OPERATION_END_MINUTE:02d} (expected 22:00)")
-            
-        print("📅 Schedule Settings Test: ✅ PASSED")
-        return True
-            
-    except ImportError as e:
-        print(f"❌ Schedule Settings Test FAILED: {e}")
-        return False
 
+@suite("Detection with New Format")
 async def test_detection_with_new_format():
     """Test news detection with the new format."""
-    print("\n🔍 TESTING DETECTION WITH NEW FORMAT")
-    print("=" * 50)
+    log.info("\n🔍 TESTING DETECTION WITH NEW FORMAT")
+    log.info("=" * 50)
     
-    try:
-        from src.services.news_detector import NewsDetector
-        from src.services.news_filter import NewsFilter
-        from src.utils.time_utils import get_formatted_time
-        
-        detector = NewsDetector()
-        
-        # Test financial news samples
-        test_cases = [
-            {
-                'text': 'قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید',
-                'should_detect': True,
-                'category': 'Gold'
-            },
-            {
-                'text': 'نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید',
-                'should_detect': True,
-                'category': 'Currency'
-            },
-            {
-                'text': 'بانک مرکزی ایران نرخ سود بانکی را اعلام کرد',
-                'should_detect': True,
-                'category': 'Iranian Economy'
-            },
-            {
-                'text': 'تیم فوتبال پرسپولیس امروز بازی دارد',
-                'should_detect': False,
-                'category': 'Sports (Non-Financial)'
-            }
-        ]
-        
-        passed_tests = 0
-        total_tests = len(test_cases)
-        
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"\n🧪 Test {i}: {test_case['category']}")
-            print(f"📝 Text: {test_case['text']}")
+    if SRC_IMPORT_ERROR:
+        raise SRC_IMPORT_ERROR
+    
+    detector = NewsDetector()
+    
+    passed_tests = 0
+    total_tests = len(TEST_CASES)
+    
+    # All previews share one timestamp
+    timestamp = get_formatted_time(format_type='persian_full')
+    
+    # Detection and relevance are computed together in one pass per text
+    classifications = [detector.classify(test_case['text']) for test_case in TEST_CASES]
+    
+    # Per-case report lines are buffered and emitted in one log call after
+    # the loop; nothing is formatted unless --verbose is set
+    verbose = log.isEnabledFor(logging.INFO)
+    report = []
+    
+    for i, (test_case, classification) in enumerate(zip(TEST_CASES, classifications), 1):
+        is_news, is_relevant, score, topics = classification
+        if verbose:
+            report.append(f"\n🧪 Test {i}: {test_case['category']}")
+            report.append(f"📝 Text: {test_case['text']}")
             
             # Test detection
-            is_news = detector.is_news(test_case['text'])
-            print(f"📊 Detected as News: {'Yes' if is_news else 'No'}")
-            
-            # Check if result matches expectation
-            if is_news == test_case['should_detect']:
-                print(f"✅ Detection Result: Correct")
-                passed_tests += 1
-            else:
-                print(f"❌ Detection Result: Incorrect (expected: {test_case['should_detect']})")
-            
-            if is_news:
-                # Test cleaning and formatting
-                cleaned = detector.clean_news_text(test_case['text'])
-                print(f"🧹 Cleaned Text: {cleaned[:80]}...")
-                
-                # Test relevance
-                try:
-                    is_relevant, score, topics = NewsFilter.is_relevant_news(cleaned)
-                    print(f"🎯 Relevant: {'Yes' if is_relevant else 'No'}")
-                    print(f"📈 Score: {score}")
-                    print(f"🏷️ Topics: {topics[:3]}")
-                    
-                    if is_relevant:
-                        # Show how it would look published
-                        timestamp = get_formatted_time(format_type='persian_full')
-                        formatted = f"{cleaned}\n📡 @anilnewsonline\n🕐 {timestamp}"
-                        
-                        print("📢 Published Format Preview:")
-                        print("-" * 20)
-                        print(formatted)
-                        print("-" * 20)
-                    
-                except Exception as e:
-                    print(f"⚠️ Filter Error: {e}")
-        
-        print(f"\n📊 Detection Test Results: {passed_tests}/{total_tests} passed")
+            report.append(f"📊 Detected as News: {'Yes' if is_news else 'No'}")
         
-        if passed_tests == total_tests:
-            print("🔍 Detection with New Format Test: ✅ PASSED")
-            return True
+        # Check if result matches expectation
+        if is_news == test_case['should_detect']:
+            if verbose:
+                report.append("✅ Detection Result: Correct")
+            passed_tests += 1
         else:
-            print("🔍 Detection with New Format Test: ❌ FAILED")
-            return False
+            log.error(f"❌ Test {i} Detection Result: Incorrect (expected: {test_case['should_detect']})")
+        
+        if is_news and verbose:
+            # Test cleaning and formatting
+            cleaned = detector.clean_news_text(test_case['text'])
+            report.append(f"🧹 Cleaned Text: {cleaned[:80]}...")
             
-    except ImportError as e:
-        print(f"❌ Detection Test FAILED: {e}")
+            # Test relevance
+            report.append(f"🎯 Relevant: {'Yes' if is_relevant else 'No'}")
+            report.append(f"📈 Score: {score}")
+            report.append(f"🏷️ Topics: {topics[:3]}")
+            
+            if is_relevant:
+                # Show how it would look published
+                formatted = f"{cleaned}\n📡 @anilnewsonline\n🕐 {timestamp}"
+                
+                report.append("📢 Published Format Preview:")
+                report.append("-" * 20)
+                report.append(formatted)
+                report.append("-" * 20)
+    
+    if report:
+        log.info("\n".join(report))
+    
+    log.info(f"\n📊 Detection Test Results: {passed_tests}/{total_tests} passed")
+    
+    if passed_tests == total_tests:
+        log.info("🔍 Detection with New Format Test: ✅ PASSED")
+        return True
+    else:
+        log.error("🔍 Detection with New Format Test: ❌ FAILED")
         return False
+        
 
+@suite("Configuration Loading")
 async def test_configuration_loading():
     """Test loading of all configuration settings."""
-    print("\n⚙️ TESTING CONFIGURATION LOADING")
-    print("=" * 50)
+    log.info("\n⚙️ TESTING CONFIGURATION LOADING")
+    log.info("=" * 50)
     
+    # Test credentials loading
+    log.info("🔐 Testing Credentials...")
     try:
-        # Test credentials loading
-        print("🔐 Testing Credentials...")
-        try:
-            from config.credentials import (
-                API_ID, API_HASH, PHONE_NUMBER, ADMIN_BOT_USERNAME, 
-                TARGET_CHANNEL_ID
-            )
-            print(f"✅ API_ID: {'Set' if API_ID else 'Not Set'}")
-            print(f"✅ API_HASH: {'Set' if API_HASH else 'Not Set'}")
-            print(f"✅ PHONE_NUMBER: {'Set' if PHONE_NUMBER else 'Not Set'}")
-            print(f"✅ ADMIN_BOT_USERNAME: {ADMIN_BOT_USERNAME or 'Not Set'}")
-            print(f"✅ TARGET_CHANNEL_ID: {TARGET_CHANNEL_ID or 'Not Set'}")
-        except Exception as e:
-            print(f"❌ Credentials loading failed: {e}")
-            return False
-        
-        # Test settings loading
-        print("\n⚙️ Testing Settings...")
-        try:
-            from config.settings import (
-                NEWS_CHANNEL, TWITTER_NEWS_CHANNEL, MIN_FINANCIAL_SCORE,
-                ENABLE_MEDIA_PROCESSING, get_settings_summary
-            )
-            print(f"✅ NEWS_CHANNEL: {NEWS_CHANNEL or 'Not Set'}")
-            print(f"✅ TWITTER_NEWS_CHANNEL: {TWITTER_NEWS_CHANNEL or 'Not Set'}")
-            print(f"✅ MIN_FINANCIAL_SCORE: {MIN_FINANCIAL_SCORE}")
-            print(f"✅ ENABLE_MEDIA_PROCESSING: {ENABLE_MEDIA_PROCESSING}")
-            
-            # Test settings summary
-            summary = get_settings_summary()
-            print(f"✅ Settings Summary: {len(summary)} items loaded")
-            
-        except Exception as e:
-            print(f"❌ Settings loading failed: {e}")
-            return False
+        if CONFIG_IMPORT_ERROR:
+            raise CONFIG_IMPORT_ERROR
+        log.info(f"✅ API_ID: {'Set' if credentials.API_ID else 'Not Set'}")
+        log.info(f"✅ API_HASH: {'Set' if credentials.API_HASH else 'Not Set'}")
+        log.info(f"✅ PHONE_NUMBER: {'Set' if credentials.PHONE_NUMBER else 'Not Set'}")
+        log.info(f"✅ ADMIN_BOT_USERNAME: {credentials.ADMIN_BOT_USERNAME or 'Not Set'}")
+        log.info(f"✅ TARGET_CHANNEL_ID: {credentials.TARGET_CHANNEL_ID or 'Not Set'}")
+    except Exception as e:
+        log.error(f"❌ Credentials loading failed: {e}")
+        return False
+    
+    # Test settings loading
+    log.info("\n⚙️ Testing Settings...")
+    try:
+        log.info(f"✅ NEWS_CHANNEL: {settings.NEWS_CHANNEL or 'Not Set'}")
+        log.info(f"✅ TWITTER_NEWS_CHANNEL: {settings.TWITTER_NEWS_CHANNEL or 'Not Set'}")
+        log.info(f"✅ MIN_FINANCIAL_SCORE: {settings.MIN_FINANCIAL_SCORE}")
+        log.info(f"✅ ENABLE_MEDIA_PROCESSING: {settings.ENABLE_MEDIA_PROCESSING}")
         
-        print("⚙️ Configuration Loading Test: ✅ PASSED")
-        return True
+        # Test settings summary
+        summary = settings.get_settings_summary()
+        log.info(f"✅ Settings Summary: {len(summary)} items loaded")
         
     except Exception as e:
-        print(f"❌ Configuration Loading Test FAILED: {e}")
+        log.error(f"❌ Settings loading failed: {e}")
         return False
+    
+    log.info("⚙️ Configuration Loading Test: ✅ PASSED")
+    return True
 
+@suite("Imports")
 async def test_imports():
     """Test all critical imports."""
-    print("\n📦 TESTING IMPORTS")
-    print("=" * 50)
-    
-    import_tests = [
-        ("Time Utils", "src.utils.time_utils"),
-        ("News Detector", "src.services.news_detector"),
-        ("News Filter", "src.services.news_filter"),
-        ("News Handler", "src.handlers.news_handler"),
-        ("Bot API Client", "src.client.bot_api"),
-        ("Telegram Client", "src.client.telegram_client"),
-        ("Logger", "src.utils.logger"),
-        ("Credentials", "config.credentials"),
-        ("Settings", "config.settings"),
-    ]
+    log.info("\n📦 TESTING IMPORTS")
+    log.info("=" * 50)
     
     passed_imports = 0
     
-    for name, module_path in import_tests:
-        try:
-            __import__(module_path)
-            print(f"✅ {name}: OK")
+    for name, module_path in IMPORT_TESTS:
+        if sys.modules.get(module_path) is not None:
+            log.info(f"✅ {name}: OK")
             passed_imports += 1
-        except ImportError as e:
-            print(f"❌ {name}: FAILED ({e})")
+        else:
+            log.error(f"❌ {name}: FAILED ({IMPORT_ERRORS.get(module_path)})")
     
-    print(f"\n📊 Import Results: {passed_imports}/{len(import_tests)} passed")
+    log.info(f"\n📊 Import Results: {passed_imports}/{len(IMPORT_TESTS)} passed")
     
-    if passed_imports == len(import_tests):
-        print("📦 Imports Test: ✅ PASSED")
+    if passed_imports == len(IMPORT_TESTS):
+        log.info("📦 Imports Test: ✅ PASSED")
         return True
     else:
-        print("📦 Imports Test: ❌ FAILED")
+        log.error("📦 Imports Test: ❌ FAILED")
         return False
 
-async def run_all_tests():
-    """Run all test suites."""
-    print("🚀 RUNNING ALL NEW FEATURE TESTS")
-    print("=" * 80)
+async def save_results(test_results):
+    """
+    Write the suite results to RESULTS_FILE as JSON.
+    
+    The file is left untouched when the results match the previous run.
+    
+    Returns:
+        bool: True if the file was (re)written
+    """
+    content = json.dumps(dict(test_results), ensure_ascii=False, indent=2)
+    
+    try:
+        previous = await asyncio.to_thread(RESULTS_FILE.read_text, encoding='utf-8')
+        if previous == content:
+            return False
+    except OSError:
+        pass
+    
+    if aiofiles:
+        async with aiofiles.open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+            await f.write(content)
+    else:
+        await asyncio.to_thread(RESULTS_FILE.write_text, content, encoding='utf-8')
+    return True
+
+async def run_all_tests(json_only=False):
+    """
+    Run all test suites.
+    
+    Args:
+        json_only: Only save RESULTS_FILE; skip the console report
+    
+    Returns:
+        bool: True if every suite passed
+    """
+    if not json_only:
+        print("🚀 RUNNING ALL NEW FEATURE TESTS")
+        print("=" * 80)
+    
+    # The suites are independent, so run them concurrently
+    tests = [
+        ("Imports", test_imports()),
+        ("Configuration Loading", test_configuration_loading()),
+        ("Persian Calendar", test_persian_calendar()),
+        ("Operating Hours", test_operating_hours()),
+        ("News Format", test_news_format()),
+        ("Media Directories", test_media_directories()),
+        ("Schedule Settings", test_schedule_settings()),
+        ("Detection with New Format", test_detection_with_new_format()),
+    ]
+    
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            (name, tg.create_task(coro, name=name))
+            for name, coro in tests
+        ]
     
-    test_results = []
+    test_results = [(name, task.result() is True) for name, task in tasks]
+    passed_tests = sum(1 for _, result in test_results if result)
+    total_tests = len(test_results)
     
-    # Run all tests
-    test_results.append(("Imports", await test_imports()))
-    test_results.append(("Configuration Loading", await test_configuration_loading()))
-    test_results.append(("Persian Calendar", await test_persian_calendar()))
-    test_results.append(("Operating Hours", await test_operating_hours()))
-    test_results.append(("News Format", await test_news_format()))
-    test_results.append(("Media Directories", await test_media_directories()))
-    test_results.append(("Schedule Settings", await test_schedule_settings()))
-    test_results.append(("Detection with New Format", await test_detection_with_new_format()))
+    await save_results(test_results)
+    if json_only:
+        return passed_tests == total_tests
     
     # Summary
     print("\n" + "=" * 80)
     print("📊 TEST RESULTS SUMMARY")
     print("=" * 80)
     
-    passed_tests = 0
-    total_tests = len(test_results)
-    
-    for test_name, result in test_results:
-        status = "✅ PASSED" if result else "❌ FAILED"
-        print(f"{test_name:<30} {status}")
-        if result:
-            passed_tests += 1
+    # Emit the table in one write rather than one print per row
+    lines = [
+        f"{test_name:<30} {'✅ PASSED' if result else '❌ FAILED'}"
+        for test_name, result in test_results
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("=" * 80)
     print(f"📈 OVERALL RESULT: {passed_tests}/{total_tests} tests passed")
@@ -440,17 +531,39 @@ async def run_all_tests():
         print("4. Verify file permissions for media directories")
         return False
 
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Test the new news detector features.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="show per-suite detail")
+    parser.add_argument("--json-only", action="store_true",
+                        help=f"only write {RESULTS_FILE.name}; skip the console report")
+    return parser.parse_args(argv)
+
 def main():
     """Main test function."""
+    args = parse_args()
+    
+    # Per-suite detail is logged at INFO and only shown with --verbose;
+    # failures and the summary are always shown.
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
+    
+    if not args.json_only:
+        print("🧪 FINANCIAL NEWS DETECTOR - NEW FEATURES TEST")
+        print("=" * 80)
+    
     try:
-        success = asyncio.run(run_all_tests())
+        with asyncio.Runner() as runner:
+            success = runner.run(run_all_tests(args.json_only))
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n⌨️ Tests interrupted by user")
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Test runner error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -4,16 +4,34 @@ Integration tests for the News Detector system.
 """
 import unittest
 import asyncio
-import tempfile
-import shutil
 from pathlib import Path
 import sys
+from datetime import date, datetime, timedelta, timezone
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.services.state_manager import StateManager
-from src.utils.time_utils import get_current_time, is_operating_hours
+from src.utils.time_utils import (
+    FORCE_24_HOUR, TEHRAN_FIXED_TZ, get_current_time, gregorian_to_persian, is_operating_hours,
+    get_next_operating_time, get_formatted_time
+)
+
+
+class MemoryBackend:
+    """In-memory stand-in for the state file storage."""
+
+    def __init__(self):
+        self.files = {}
+
+    def read_text(self, path):
+        try:
+            return self.files[path]
+        except KeyError:
+            raise FileNotFoundError(path)
+
+    def write_text(self, path, content):
+        self.files[path] = content
 
 
 class TestStateManager(unittest.TestCase):
@@ -21,17 +39,13 @@ class TestStateManager(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.state_file = Path(self.temp_dir) / "test_state.json"
+        self.state_file = Path("test_state.json")
         
-        # Create a state manager with custom path
-        self.state_manager = StateManager()
+        # Create a state manager that never touches the disk
+        self.backend = MemoryBackend()
+        self.state_manager = StateManager(backend=self.backend)
         self.state_manager.state_file = self.state_file
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
     def test_save_and_load_state(self):
         """Test saving and loading state data."""
         test_data = {
@@ -43,6 +57,7 @@ class TestStateManager(unittest.TestCase):
         loaded_data = self.state_manager.load_state()
         
         self.assertEqual(loaded_data, test_data)
+        self.assertIn(self.state_file, self.backend.files)
 
     def test_get_set_state_value(self):
         """Test getting and setting individual state values."""
@@ -64,7 +79,16 @@ class TestTimeUtils(unittest.TestCase):
         """Test getting current time in Tehran timezone."""
         current_time = get_current_time()
         self.assertIsNotNone(current_time)
-        self.assertEqual(current_time.tzinfo.zone, 'Asia/Tehran')
+        self.assertEqual(current_time.utcoffset(), timedelta(hours=3, minutes=30))
+
+    def test_gregorian_to_persian(self):
+        """Test Persian calendar conversion around Nowruz and leap days."""
+        self.assertEqual(gregorian_to_persian(date(2024, 3, 19)), (1402, 12, 29))
+        self.assertEqual(gregorian_to_persian(date(2024, 3, 20)), (1403, 1, 1))
+        self.assertEqual(gregorian_to_persian(date(2025, 3, 21)), (1404, 1, 1))
+        self.assertEqual(gregorian_to_persian(date(2024, 10, 1)), (1403, 7, 10))
+        # Outside the precomputed year table
+        self.assertEqual(gregorian_to_persian(date(1700, 3, 21)), (1079, 1, 1))
 
     def test_operating_hours_check(self):
         """Test operating hours validation."""
@@ -72,6 +96,26 @@ class TestTimeUtils(unittest.TestCase):
         result = is_operating_hours()
         self.assertIsInstance(result, bool)
 
+    @unittest.skipIf(FORCE_24_HOUR, "FORCE_24_HOUR_OPERATION disables the operating window")
+    def test_next_operating_time_converts_to_tehran(self):
+        """Test a non-Tehran datetime is interpreted in Tehran time."""
+        # 03:00 UTC is 06:30 in Tehran, two hours before the 08:30 opening
+        utc_time = datetime(2024, 10, 1, 3, 0, tzinfo=timezone.utc)
+        
+        next_time = get_next_operating_time(utc_time)
+        
+        self.assertEqual((next_time.hour, next_time.minute), (8, 30))
+        self.assertEqual(next_time.utcoffset(), timedelta(hours=3, minutes=30))
+        self.assertEqual(next_time - utc_time, timedelta(hours=2))
+
+    def test_formatted_time_keeps_wall_clock(self):
+        """Test Persian formatting does not shift an explicit datetime's clock time."""
+        # Pre-2022 summer date, when Asia/Tehran observed +04:30 DST
+        dt = datetime(2020, 7, 1, 12, 0, tzinfo=TEHRAN_FIXED_TZ)
+        
+        self.assertEqual(get_formatted_time(dt, 'persian_full'), "1399-04-11 12:00")
+        self.assertEqual(get_formatted_time(dt, 'persian_time'), get_formatted_time(dt, 'time')[:5])
+
 
 class TestAsyncIntegration(unittest.IsolatedAsyncioTestCase):
     """Async integration tests."""
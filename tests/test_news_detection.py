@@ -6,20 +6,23 @@ Unit tests for news detection functionality.
 import unittest
 import sys
 from pathlib import Path
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.services.news_detector import NewsDetector
+from src.services import news_filter
 from src.services.news_filter import NewsFilter
 
 
 class TestNewsDetection(unittest.TestCase):
     """Test cases for news detection."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.detector = NewsDetector()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one detector shared by all tests in the class."""
+        cls.detector = NewsDetector()
 
     def test_war_news_detection(self):
         """Test detection of war-related news."""
@@ -61,6 +64,50 @@ class TestNewsDetection(unittest.TestCase):
         # Should be detected as news format but filtered out by relevance
         self.assertFalse(self.detector.is_news(sports_news))
 
+    def test_batch_detection_matches_single(self):
+        """Test batch detection returns the same results as is_news."""
+        texts = [
+            "نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید",
+            "سلام",
+        ]
+        
+        expected = [self.detector.is_news(text) for text in texts]
+        self.assertEqual(self.detector.is_news_batch(texts), expected)
+
+    def test_classify_matches_two_stage(self):
+        """Test classify agrees with is_news followed by is_relevant_news."""
+        gold_news = "قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید"
+        sports_news = "تیم فوتبال پرسپولیس امروز بازی دارد و هواداران منتظر هستند"
+        
+        self.assertEqual(
+            self.detector.classify(gold_news),
+            (True, *NewsFilter.is_relevant_news(gold_news))
+        )
+        self.assertEqual(self.detector.classify(sports_news), (False, False, 0, []))
+        self.assertEqual(self.detector.classify("سلام"), (False, False, 0, []))
+
+    def test_classify_cache(self):
+        """Test repeated classify calls are served from a bounded cache."""
+        detector = NewsDetector()
+        detector.CLASSIFY_CACHE_SIZE = 2
+        gold_news = "قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید"
+        
+        first = detector.classify(gold_news)
+        first[3].append("MUTATED")
+        self.assertEqual(detector.classify(gold_news)[3], first[3][:-1])
+        
+        detector.classify(gold_news + " امروز")
+        detector.classify(gold_news + " دیروز")
+        self.assertEqual(len(detector._classify_cache), 2)
+
+    def test_arabic_letter_variants_detection(self):
+        """Test Arabic yeh/kaf spellings are detected like Persian ones."""
+        persian = "قیمت طلای ۱۸ عیار امروز در بازار تهران به ۲ میلیون تومان رسید"
+        arabic = persian.replace("ی", "\u064a").replace("ک", "\u0643")
+        
+        self.assertNotEqual(persian, arabic)
+        self.assertEqual(self.detector.classify(arabic), self.detector.classify(persian))
+
     def test_short_content_rejection(self):
         """Test rejection of very short content."""
         short_text = "سلام"
@@ -125,6 +172,27 @@ class TestNewsFiltering(unittest.TestCase):
         
         self.assertFalse(is_relevant)
 
+    def test_batch_relevance_matches_single(self):
+        """Test batch relevance returns the same results as is_relevant_news."""
+        texts = [
+            "قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید",
+            "جشنواره فیلم کن امسال",
+        ]
+        
+        expected = [NewsFilter.is_relevant_news(text) for text in texts]
+        self.assertEqual(NewsFilter.is_relevant_news_batch(texts), expected)
+
+    @unittest.skipIf(news_filter.ahocorasick is None, "pyahocorasick not installed")
+    def test_keyword_automaton_matches_substring_scan(self):
+        """Test the Aho-Corasick keyword scan scores like plain substring checks."""
+        text = "قیمت طلا و دلار در بازار تهران پس از تحریم‌های جدید افزایش یافت"
+        
+        with_automaton = NewsFilter.is_relevant_news(text)
+        with mock.patch.object(news_filter, "_KEYWORD_AUTOMATON", None):
+            without_automaton = NewsFilter.is_relevant_news(text)
+        
+        self.assertEqual(with_automaton, without_automaton)
+
     def test_economic_warfare_content(self):
         """Test economic warfare content detection."""
         economic_warfare = """
@@ -181,6 +249,16 @@ class TestNewsSegmentation(unittest.TestCase):
         self.assertEqual(len(segments), 1)
         self.assertEqual(segments[0], single_news)
 
+    def test_combined_news_min_segment_length(self):
+        """Test split_combined_news splits mixed separators and drops short segments."""
+        gold = "قیمت طلای ۱۸ عیار امروز به ۲ میلیون و ۵۰۰ هزار تومان رسید"
+        dollar = "نرخ دلار در بازار آزاد به ۵۲ هزار تومان رسید و بالا رفت"
+        combined = f"{gold}\n------\n{dollar}\n***\nخبر کوتاه"
+        
+        segments = NewsDetector().split_combined_news(combined)
+        
+        self.assertEqual(segments, [gold, dollar])
+
 
 if __name__ == '__main__':
     # Run all tests